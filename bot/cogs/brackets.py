@@ -1,7 +1,7 @@
 """Brackets cog - /bracket generate, view, update (Moderator+ for generate/update)."""
 from __future__ import annotations
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -11,7 +11,12 @@ from discord import app_commands
 from bot.checks import mod_or_higher
 from bot.models import Bracket, BracketMatch, Player, Registration, Team, TeamManualMember, Tournament, TournamentManualEntry
 from bot.models.base import get_async_session
-from bot.services.bracket_gen import advance_rounds_until_incomplete, advance_winner_to_parent, create_single_elim_bracket
+from bot.services.bracket_gen import (
+    MATCH_HAS_WINNER,
+    advance_rounds_until_incomplete,
+    advance_winner_to_parent,
+    create_single_elim_bracket,
+)
 from bot.services.discord_embeds import (
     build_results_embed,
     build_round_lineup_embed,
@@ -769,13 +774,7 @@ async def update(
         champ_result = await session.execute(
             select(BracketMatch)
             .where(BracketMatch.bracket_id == bracket.id)
-            .where(
-                or_(
-                    BracketMatch.winner_team_id != None,  # noqa: E711
-                    BracketMatch.winner_player_id != None,  # noqa: E711
-                    BracketMatch.winner_manual_entry_id != None,  # noqa: E711
-                )
-            )
+            .where(MATCH_HAS_WINNER)
         )
         champ_matches = champ_result.scalars().all()
         max_round = None
@@ -1,5 +1,5 @@
 """Database base and session setup."""
-from sqlalchemy import text
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
@@ -11,11 +11,32 @@ class Base(DeclarativeBase):
     pass
 
 
+def _pool_kwargs(url: str) -> dict:
+    """Queue pool sizing for file/server databases. In-memory SQLite uses a single static connection."""
+    if ":memory:" in url:
+        return {}
+    return {"pool_size": 20, "max_overflow": 40, "pool_recycle": 1800, "pool_pre_ping": False}
+
+
 engine = create_async_engine(
     config.DATABASE_URL,
     echo=False,
+    query_cache_size=1200,  # headroom for the lambda_stmt / compiled statement cache
+    **_pool_kwargs(config.DATABASE_URL),
 )
 
+if config.DATABASE_URL.startswith("sqlite") and ":memory:" not in config.DATABASE_URL:
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _sqlite_pragmas(dbapi_connection, connection_record) -> None:
+        """WAL lets the web API read while the bot writes; NORMAL sync is safe under WAL."""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
+
+# expire_on_commit=False: routes build responses from objects after commit without reloading them
 async_session_factory = async_sessionmaker(
     engine,
     class_=AsyncSession,
@@ -25,7 +46,7 @@ async_session_factory = async_sessionmaker(
 
 
 async def get_async_session():
-    """Async generator yielding database sessions. Use: async for session in get_async_session(): ..."""
+    """Async generator yielding database sessions. FastAPI dependency: session: AsyncSession = Depends(get_async_session)."""
     async with async_session_factory() as session:
         yield session
 
@@ -49,6 +70,14 @@ _MIGRATIONS = [
     "ALTER TABLE tournament_manual_entries ADD COLUMN original_list_type VARCHAR(16)",
     "UPDATE tournament_manual_entries SET original_list_type = list_type WHERE original_list_type IS NULL",
     "ALTER TABLE tournaments ADD COLUMN archived INTEGER DEFAULT 0",
+    # The bracket ETag hashes the response body; drop the unused updated_at index from older DBs
+    "DROP INDEX IF EXISTS ix_bracket_matches_bracket_id_updated_at",
+    "CREATE INDEX IF NOT EXISTS ix_bracket_matches_bracket_section_round ON bracket_matches(bracket_id, bracket_section, round_num, match_num)",
+    "CREATE INDEX IF NOT EXISTS ix_tournament_manual_entries_list_order ON tournament_manual_entries(tournament_id, list_type, sort_order)",
+    "CREATE INDEX IF NOT EXISTS ix_team_manual_members_team_id_sort_order ON team_manual_members(team_id, sort_order)",
+    # SQLite can only ADD a VIRTUAL generated column; indexing it still gives an index range scan
+    "ALTER TABLE tournament_manual_entries ADD COLUMN effective_original_list_type VARCHAR(16) GENERATED ALWAYS AS (COALESCE(original_list_type, list_type)) VIRTUAL",
+    "CREATE INDEX IF NOT EXISTS ix_tournament_manual_entries_effective_list_order ON tournament_manual_entries(tournament_id, effective_original_list_type, sort_order)",
     # Recover from failed migration: ensure players table exists (e.g. if DROP succeeded but RENAME failed)
     "CREATE TABLE IF NOT EXISTS players (discord_id INTEGER NOT NULL PRIMARY KEY, display_name VARCHAR(128), epic_username VARCHAR(64), epic_id VARCHAR(32))",
 ]
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from typing import Optional
 
-from sqlalchemy import ForeignKey, Integer, String
+from sqlalchemy import ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from bot.models.base import Base
@@ -28,6 +28,10 @@ class BracketMatch(Base):
     """Single match in a bracket."""
 
     __tablename__ = "bracket_matches"
+    __table_args__ = (
+        # Per-bracket section/round lookups (advancement, champion checks) and ordered bracket reads
+        Index("ix_bracket_matches_bracket_section_round", "bracket_id", "bracket_section", "round_num", "match_num"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     bracket_id: Mapped[int] = mapped_column(ForeignKey("brackets.id"), nullable=False)
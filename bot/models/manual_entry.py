@@ -1,7 +1,7 @@
 """Manual participant and standby entries for tournaments."""
 from __future__ import annotations
 
-from sqlalchemy import ForeignKey, Integer, String
+from sqlalchemy import Computed, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from bot.models.base import Base
@@ -11,6 +11,16 @@ class TournamentManualEntry(Base):
     """Manually editable participant or standby entry for a tournament."""
 
     __tablename__ = "tournament_manual_entries"
+    # Covers list filters and MAX(sort_order) when appending to a list
+    __table_args__ = (
+        Index("ix_tournament_manual_entries_list_order", "tournament_id", "list_type", "sort_order"),
+        Index(
+            "ix_tournament_manual_entries_effective_list_order",
+            "tournament_id",
+            "effective_original_list_type",
+            "sort_order",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     tournament_id: Mapped[int] = mapped_column(ForeignKey("tournaments.id"), nullable=False)
@@ -19,6 +29,10 @@ class TournamentManualEntry(Base):
     list_type: Mapped[str] = mapped_column(String(16), nullable=False)  # participant | standby
     original_list_type: Mapped[str | None] = mapped_column(String(16), nullable=True)  # never changes; for standby recognition
     sort_order: Mapped[int] = mapped_column(Integer, default=0)
+    # original_list_type with fallback for rows created before it existed; indexed for standby lookups
+    effective_original_list_type: Mapped[str] = mapped_column(
+        String(16), Computed("COALESCE(original_list_type, list_type)", persisted=False)
+    )
 
     tournament: Mapped["Tournament"] = relationship("Tournament", back_populates="manual_entries")
     team_memberships = relationship(
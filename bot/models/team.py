@@ -1,7 +1,7 @@
 """Team model for 2v2/3v3 tournaments."""
 from __future__ import annotations
 
-from sqlalchemy import ForeignKey, Integer, String
+from sqlalchemy import ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from bot.models.base import Base
@@ -21,7 +21,10 @@ class Team(Base):
         "Registration", back_populates="team", cascade="all, delete-orphan"
     )
     manual_members = relationship(
-        "TeamManualMember", back_populates="team", cascade="all, delete-orphan"
+        "TeamManualMember",
+        back_populates="team",
+        cascade="all, delete-orphan",
+        order_by="TeamManualMember.sort_order",
     )
 
 
@@ -29,6 +32,8 @@ class TeamManualMember(Base):
     """Manual entry as a team member (for teams created from manual participant list)."""
 
     __tablename__ = "team_manual_members"
+    # Serves selectinload(Team.manual_members): WHERE team_id IN (...) ORDER BY sort_order
+    __table_args__ = (Index("ix_team_manual_members_team_id_sort_order", "team_id", "sort_order"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     team_id: Mapped[int] = mapped_column(ForeignKey("teams.id"), nullable=False)
@@ -1,7 +1,9 @@
 """Tournament model."""
 from __future__ import annotations
 
+import re
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
 from sqlalchemy import BigInteger, Boolean, DateTime, Integer, String
@@ -10,11 +12,14 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from bot.models.base import Base
 
 
+_FORMAT_RE = re.compile(r"(\d+)v\d+", re.I)
+
+
 # Supported formats: 1v1, 2v2, 3v3, 4v4, or custom (e.g. "custom: 4v4")
+@lru_cache(maxsize=64)
 def parse_format_players(format_str: str) -> int:
     """Return number of players per side (1 for 1v1, 2 for 2v2, etc.)."""
-    import re
-    m = re.search(r"(\d+)v\d+", format_str, re.I)
+    m = _FORMAT_RE.search(format_str)
     return int(m.group(1)) if m else 2
 
 
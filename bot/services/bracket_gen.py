@@ -4,9 +4,9 @@ from __future__ import annotations
 import random
 from typing import Any, List, Optional, Tuple
 
-from sqlalchemy import select
+from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 
 from bot.models import (
     Bracket,
@@ -21,6 +21,13 @@ from bot.models.tournament import parse_format_players
 from bot.services.rl_api import RLAPIService
 import config
 
+# WHERE clause for matches that have a winner recorded (shared by the bot and web API)
+MATCH_HAS_WINNER = or_(
+    BracketMatch.winner_team_id.is_not(None),
+    BracketMatch.winner_player_id.is_not(None),
+    BracketMatch.winner_manual_entry_id.is_not(None),
+)
+
 
 async def get_registrations_with_mmr(
     session: AsyncSession,
@@ -269,17 +276,15 @@ async def create_manual_bracket(
     players_per_team = parse_format_players(t.format)
 
     if is_team and team_assignments:
-        # Create teams from team_assignments
-        teams = []
-        for team_name, entry_ids in team_assignments.items():
-            team = Team(tournament_id=tournament_id, name=team_name)
-            session.add(team)
-            await session.flush()
-            for i, eid in enumerate(entry_ids):
-                session.add(
-                    TeamManualMember(team_id=team.id, manual_entry_id=eid, sort_order=i)
-                )
-            teams.append(team)
+        # Create teams from team_assignments (one flush for all teams, then their members)
+        teams = [Team(tournament_id=tournament_id, name=team_name) for team_name in team_assignments]
+        session.add_all(teams)
+        await session.flush()
+        session.add_all(
+            TeamManualMember(team_id=team.id, manual_entry_id=eid, sort_order=i)
+            for team, entry_ids in zip(teams, team_assignments.values())
+            for i, eid in enumerate(entry_ids)
+        )
         seeded = [(team.id, True) for team in teams]
     elif is_team:
         # Use existing teams, or auto-create from manual participants
@@ -303,23 +308,18 @@ async def create_manual_bracket(
             entries = entries_result.scalars().all()
             if len(entries) < players_per_team:
                 return None
-            team_num = 0
-            for i in range(0, len(entries), players_per_team):
-                chunk = entries[i : i + players_per_team]
-                if len(chunk) < players_per_team:
-                    break
-                team = Team(
-                    tournament_id=tournament_id,
-                    name=f"Team {team_num + 1}",
-                )
-                session.add(team)
-                await session.flush()
-                for j, entry in enumerate(chunk):
-                    session.add(
-                        TeamManualMember(team_id=team.id, manual_entry_id=entry.id, sort_order=j)
-                    )
-                teams.append(team)
-                team_num += 1
+            chunks = [
+                entries[i : i + players_per_team]
+                for i in range(0, len(entries) - players_per_team + 1, players_per_team)
+            ]
+            teams = [Team(tournament_id=tournament_id, name=f"Team {n + 1}") for n in range(len(chunks))]
+            session.add_all(teams)
+            await session.flush()
+            session.add_all(
+                TeamManualMember(team_id=team.id, manual_entry_id=entry.id, sort_order=j)
+                for team, chunk in zip(teams, chunks)
+                for j, entry in enumerate(chunk)
+            )
             if not teams:
                 return None
         seeded = [(team.id, True) for team in teams]
@@ -440,25 +440,41 @@ async def advance_winner_to_parent(
                 await session.flush()  # Ensure loser assignment is persisted
 
 
+async def _load_single_elim_rounds(
+    session: AsyncSession, bracket_id: int
+) -> dict[int, List[BracketMatch]]:
+    """Load all single-elim matches of a bracket in one query, grouped by round and ordered by match_num."""
+    result = await session.execute(
+        select(BracketMatch)
+        .where(
+            BracketMatch.bracket_id == bracket_id,
+            BracketMatch.bracket_section.is_(None),
+        )
+        .order_by(BracketMatch.round_num, BracketMatch.match_num)
+    )
+    rounds: dict[int, List[BracketMatch]] = {}
+    for m in result.scalars():
+        rounds.setdefault(m.round_num, []).append(m)
+    return rounds
+
+
 async def advance_round_when_complete(
-    session: AsyncSession, bracket_id: int, round_num: int, is_team: bool
+    session: AsyncSession,
+    bracket_id: int,
+    round_num: int,
+    is_team: bool,
+    rounds: Optional[dict[int, List[BracketMatch]]] = None,
 ) -> bool:
     """
     When all matches in a round have winners, advance them to the next round.
     Randomize who gets the bye slot, excluding any team that had a bye in this round.
     Only runs for single_elim; no-op if round incomplete or no next round.
+    Pass rounds (from _load_single_elim_rounds) to reuse already-loaded matches.
     Returns True if the round was advanced, False otherwise.
     """
-    result = await session.execute(
-        select(BracketMatch)
-        .where(
-            BracketMatch.bracket_id == bracket_id,
-            BracketMatch.round_num == round_num,
-            BracketMatch.bracket_section.is_(None),
-        )
-        .order_by(BracketMatch.match_num)
-    )
-    round_matches = list(result.scalars().all())
+    if rounds is None:
+        rounds = await _load_single_elim_rounds(session, bracket_id)
+    round_matches = rounds.get(round_num, [])
     if not round_matches:
         return False
 
@@ -471,22 +487,11 @@ async def advance_round_when_complete(
             entity = _get_entity_from_slot(m, 1, is_team)
             if entity:
                 _assign_winner_from_entity(m, entity, is_team)
-                await session.flush()
         if not entity:
             return False  # Round not complete
         winners.append((m, entity, had_bye))
 
-    # Get next round matches
-    next_result = await session.execute(
-        select(BracketMatch)
-        .where(
-            BracketMatch.bracket_id == bracket_id,
-            BracketMatch.round_num == round_num + 1,
-            BracketMatch.bracket_section.is_(None),
-        )
-        .order_by(BracketMatch.match_num)
-    )
-    next_matches = list(next_result.scalars().all())
+    next_matches = rounds.get(round_num + 1, [])
     if not next_matches:
         return False
 
@@ -538,9 +543,10 @@ async def advance_round_when_complete(
         other = 2 if pslot == 1 else 1
         structural_bye.add((pid, other))
 
+    next_by_id = {nm.id: nm for nm in next_matches}
     for winner in winners:
         m, entity = winner[0], winner[1]
-        parent = await session.get(BracketMatch, m.parent_match_id)
+        parent = next_by_id.get(m.parent_match_id)
         if not parent:
             continue
         _assign_entity_to_match(parent, m.parent_match_slot, entity, is_team)
@@ -555,7 +561,7 @@ async def advance_round_when_complete(
                 parent.winner_manual_entry_id = parent.manual_entry1_id
             else:
                 parent.winner_player_id = parent.player1_id
-            await advance_round_when_complete(session, bracket_id, round_num + 1, is_team)
+            await advance_round_when_complete(session, bracket_id, round_num + 1, is_team, rounds)
         elif has_s2 and not has_s1 and is_struct_bye:
             if is_team:
                 parent.winner_team_id = parent.team2_id
@@ -563,7 +569,7 @@ async def advance_round_when_complete(
                 parent.winner_manual_entry_id = parent.manual_entry2_id
             else:
                 parent.winner_player_id = parent.player2_id
-            await advance_round_when_complete(session, bracket_id, round_num + 1, is_team)
+            await advance_round_when_complete(session, bracket_id, round_num + 1, is_team, rounds)
     return True
 
 
@@ -572,21 +578,13 @@ async def advance_rounds_until_incomplete(
 ) -> bool:
     """Advance start_round, then keep advancing subsequent rounds until one is incomplete.
     Returns True if at least one round was advanced, False otherwise."""
+    rounds = await _load_single_elim_rounds(session, bracket_id)
     r = start_round
     any_advanced = False
     while True:
-        advanced = await advance_round_when_complete(session, bracket_id, r, is_team)
+        advanced = await advance_round_when_complete(session, bracket_id, r, is_team, rounds)
         any_advanced = any_advanced or advanced
-        await session.flush()
-        next_result = await session.execute(
-            select(BracketMatch)
-            .where(
-                BracketMatch.bracket_id == bracket_id,
-                BracketMatch.round_num == r + 1,
-                BracketMatch.bracket_section.is_(None),
-            )
-        )
-        next_matches = list(next_result.scalars().all())
+        next_matches = rounds.get(r + 1, [])
         if not next_matches:
             break
         all_complete = True
@@ -600,6 +598,7 @@ async def advance_rounds_until_incomplete(
         if not all_complete:
             break
         r += 1
+    await session.flush()
     return any_advanced
 
 
@@ -703,17 +702,35 @@ def _clear_slot(m: BracketMatch, slot: int, is_team: bool) -> None:
             m.player2_id = None
 
 
+def _match_with_bracket_select(tournament_id: int):
+    """Select matches in a tournament with their bracket and tournament joined in."""
+    return (
+        select(BracketMatch)
+        .join(BracketMatch.bracket)
+        .where(Bracket.tournament_id == tournament_id)
+        .options(joinedload(BracketMatch.bracket).joinedload(Bracket.tournament))
+    )
+
+
+async def load_match_with_bracket(
+    session: AsyncSession, match_id: int, tournament_id: int
+) -> Optional[BracketMatch]:
+    """Load a match with bracket and tournament in one query. None if missing or in another tournament."""
+    result = await session.execute(
+        _match_with_bracket_select(tournament_id).where(BracketMatch.id == match_id)
+    )
+    return result.scalars().first()
+
+
 async def clear_match_winner(
     session: AsyncSession, match_id: int, tournament_id: int
 ) -> None:
     """Clear the winner of a match and remove from parent/loser slots. Cascades to clear downstream."""
-    match = await session.get(BracketMatch, match_id)
+    match = await load_match_with_bracket(session, match_id, tournament_id)
     if not match:
         raise ValueError("Match not found")
-    bracket = await session.get(Bracket, match.bracket_id)
-    if not bracket or bracket.tournament_id != tournament_id:
-        raise ValueError("Match not found")
-    t = await session.get(Tournament, bracket.tournament_id)
+    bracket = match.bracket
+    t = bracket.tournament
     is_team = t and t.format != "1v1"
 
     if not (match.winner_team_id or match.winner_player_id or match.winner_manual_entry_id):
@@ -747,17 +764,15 @@ async def swap_slots(
     """Swap or move entities between two bracket slots. Clears winners for affected matches."""
     if from_match_id == to_match_id and from_slot == to_slot:
         return
-    from_match = await session.get(BracketMatch, from_match_id)
-    to_match = await session.get(BracketMatch, to_match_id)
+    # Load the whole bracket in one query so the ancestor walks below hit the identity map
+    result = await session.execute(_match_with_bracket_select(tournament_id))
+    by_id = {m.id: m for m in result.scalars()}
+    from_match = by_id.get(from_match_id)
+    to_match = by_id.get(to_match_id)
     if not from_match or not to_match:
         raise ValueError("Match not found")
-    b = await session.get(Bracket, from_match.bracket_id)
-    if not b or b.tournament_id != tournament_id:
-        raise ValueError("Match not found")
-    to_b = await session.get(Bracket, to_match.bracket_id)
-    if not to_b or to_b.tournament_id != tournament_id:
-        raise ValueError("Match not found")
-    t = await session.get(Tournament, b.tournament_id)
+    b = from_match.bracket
+    t = b.tournament
     is_team = t and t.format != "1v1"
 
     from_entity = _get_entity_from_slot(from_match, from_slot, is_team)
@@ -788,13 +803,11 @@ async def swap_match_winner(
     session: AsyncSession, match_id: int, tournament_id: int
 ) -> None:
     """Swap the winner of a match to the other team. Updates parent slot and clears downstream winners."""
-    match = await session.get(BracketMatch, match_id)
+    match = await load_match_with_bracket(session, match_id, tournament_id)
     if not match:
         raise ValueError("Match not found")
-    bracket = await session.get(Bracket, match.bracket_id)
-    if not bracket or bracket.tournament_id != tournament_id:
-        raise ValueError("Match not found")
-    t = await session.get(Tournament, bracket.tournament_id)
+    bracket = match.bracket
+    t = bracket.tournament
     is_team = t and t.format != "1v1"
 
     winner_entity = _get_winner_entity(match, is_team)
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from collections import Counter
 
-from sqlalchemy import or_, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -17,6 +17,7 @@ from bot.models import (
     TeamManualMember,
     TournamentManualEntry,
 )
+from bot.services.bracket_gen import MATCH_HAS_WINNER
 
 
 async def resolve_entity(
@@ -69,7 +70,7 @@ async def resolve_entity(
                     member_names.append(n or str(m.player_id))
             member_names += [
                 m.manual_entry.display_name
-                for m in sorted(team.manual_members, key=lambda x: x.sort_order)
+                for m in team.manual_members
                 if m.manual_entry
             ]
             return team.name + " (" + ", ".join(member_names) + ")" if member_names else team.name
@@ -160,13 +161,7 @@ async def get_champion_info(
     result = await session.execute(
         select(BracketMatch)
         .where(BracketMatch.bracket_id == bracket.id)
-        .where(
-            or_(
-                BracketMatch.winner_team_id != None,  # noqa: E711
-                BracketMatch.winner_player_id != None,  # noqa: E711
-                BracketMatch.winner_manual_entry_id != None,  # noqa: E711
-            )
-        )
+        .where(MATCH_HAS_WINNER)
     )
     champ_matches = result.scalars().all()
     if bracket.bracket_type == "round_robin":
@@ -198,7 +193,7 @@ async def get_champion_info(
                         members.append(
                             await resolve_entity(session, reg.player_id, False, guild, client)
                         )
-                for tmm in sorted(team.manual_members, key=lambda x: x.sort_order):
+                for tmm in team.manual_members:
                     if tmm.manual_entry:
                         members.append(tmm.manual_entry.display_name)
                 return name, members if members else None
@@ -237,7 +232,7 @@ async def get_champion_info(
                     members.append(
                         await resolve_entity(session, reg.player_id, False, guild, client)
                     )
-            for tmm in sorted(team.manual_members, key=lambda x: x.sort_order):
+            for tmm in team.manual_members:
                 if tmm.manual_entry:
                     members.append(tmm.manual_entry.display_name)
             return name, members if members else None
@@ -241,6 +241,45 @@ async def test_settings(client, auth_headers):
     )
     assert r.status_code == 200
     assert r.json()["site_title"] == "Test Title"
+    r = await client.get("/api/settings")
+    assert r.json()["site_title"] == "Test Title"
+
+    r = await client.post(
+        "/api/settings/import",
+        json={"settings": {"site_title": "Imported", "accent_color": "#123456"}},
+        headers=auth_headers,
+    )
+    assert r.json() == {"ok": True, "restored": 2}
+    r = await client.get("/api/settings/export", headers=auth_headers)
+    assert r.json()["settings"]["site_title"] == "Imported"
+    r = await client.get("/api/settings")
+    assert r.json()["site_title"] == "Imported"
+    assert r.json()["accent_color"] == "#123456"
+    assert r.headers["cache-control"] == "no-cache"
+    etag = r.headers["etag"]
+    r = await client.get("/api/settings", headers={"If-None-Match": etag})
+    assert r.status_code == 304
+    await client.patch("/api/settings", json={"site_title": "Changed"}, headers=auth_headers)
+    r = await client.get("/api/settings", headers={"If-None-Match": etag})
+    assert r.status_code == 200
+    assert r.headers["etag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_discord_bracket_settings(client, auth_headers):
+    """Bracket channel PATCH stores the values and returns every Discord key."""
+    r = await client.patch(
+        "/api/settings/discord",
+        json={"discord_bracket_channel_id": "123", "discord_bracket_channel_name": "brackets"},
+        headers=auth_headers,
+    )
+    assert r.status_code == 200
+    data = r.json()
+    assert data["discord_bracket_channel_id"] == "123"
+    assert data["discord_bracket_channel_name"] == "brackets"
+    assert data["discord_signup_channel_id"] == ""
+    r = await client.get("/api/settings/discord")
+    assert r.json() == data
 
 
 @pytest.mark.asyncio
@@ -341,3 +380,677 @@ async def test_clone_tournament(client, auth_headers):
     r = await client.get(f"/api/tournaments/{cid}/standby")
     assert len(r.json()) == 1
     assert r.json()[0]["display_name"] == "S1"
+
+
+@pytest.mark.asyncio
+async def test_bracket_etag_not_modified(client, auth_headers):
+    """Bracket GET returns an ETag; matching If-None-Match yields 304 until a match changes."""
+    r = await client.post("/api/tournaments", json={"name": "ETag Test", "format": "1v1"})
+    tid = r.json()["id"]
+    for name in ("P1", "P2", "P3", "P4"):
+        await client.post(
+            f"/api/tournaments/{tid}/participants",
+            json={"display_name": name},
+            headers=auth_headers,
+        )
+    r = await client.post(
+        f"/api/tournaments/{tid}/bracket/generate",
+        json={"bracket_type": "single_elim"},
+        headers=auth_headers,
+    )
+    assert r.status_code == 200
+
+    r = await client.get(f"/api/tournaments/{tid}/bracket")
+    assert r.status_code == 200
+    etag = r.headers["etag"]
+    r = await client.get(f"/api/tournaments/{tid}/bracket", headers={"If-None-Match": etag})
+    assert r.status_code == 304
+
+    match = (await client.get(f"/api/tournaments/{tid}/bracket")).json()["rounds"]["1"][0]
+    r = await client.patch(
+        f"/api/tournaments/{tid}/bracket/matches/{match['id']}",
+        json={"winner_manual_entry_id": match["manual_entry1_id"]},
+        headers=auth_headers,
+    )
+    assert r.status_code == 200
+    r = await client.get(f"/api/tournaments/{tid}/bracket", headers={"If-None-Match": etag})
+    assert r.status_code == 200
+    assert r.headers["etag"] != etag
+
+    etag = r.headers["etag"]
+    r = await client.patch(
+        f"/api/tournaments/{tid}/participants/{match['manual_entry2_id']}",
+        json={"display_name": "RENAMED"},
+        headers=auth_headers,
+    )
+    assert r.status_code == 200
+    r = await client.get(f"/api/tournaments/{tid}/bracket", headers={"If-None-Match": etag})
+    assert r.status_code == 200
+    assert "RENAMED" in r.text
+
+
+@pytest.mark.asyncio
+async def test_reorder_participants(client, auth_headers):
+    """Reorder rewrites sort_order for the given ids and ignores ids from other lists."""
+    r = await client.post("/api/tournaments", json={"name": "Reorder Test", "format": "1v1"}, headers=auth_headers)
+    tid = r.json()["id"]
+    ids = []
+    for name in ["A", "B", "C"]:
+        r = await client.post(f"/api/tournaments/{tid}/participants", json={"display_name": name}, headers=auth_headers)
+        ids.append(r.json()["id"])
+    r = await client.post(f"/api/tournaments/{tid}/standby", json={"display_name": "S"}, headers=auth_headers)
+    standby_id = r.json()["id"]
+
+    r = await client.patch(
+        f"/api/tournaments/{tid}/participants/reorder",
+        json={"entry_ids": [ids[2], standby_id, ids[0], ids[1]]},
+        headers=auth_headers,
+    )
+    assert r.status_code == 200
+    r = await client.get(f"/api/tournaments/{tid}/participants")
+    assert [p["display_name"] for p in r.json()] == ["C", "A", "B"]
+    r = await client.get(f"/api/tournaments/{tid}/standby")
+    assert r.json()[0]["sort_order"] == 0
+
+
+@pytest.mark.asyncio
+async def test_update_teams_skips_foreign_entries(client, auth_headers):
+    """PUT teams keeps only manual entries belonging to the tournament."""
+    r = await client.post("/api/tournaments", json={"name": "Teams Test", "format": "2v2"}, headers=auth_headers)
+    tid = r.json()["id"]
+    r = await client.post("/api/tournaments", json={"name": "Other", "format": "2v2"}, headers=auth_headers)
+    other_tid = r.json()["id"]
+    ids = []
+    for name in ["A", "B", "C"]:
+        r = await client.post(f"/api/tournaments/{tid}/participants", json={"display_name": name}, headers=auth_headers)
+        ids.append(r.json()["id"])
+    r = await client.post(f"/api/tournaments/{other_tid}/participants", json={"display_name": "X"}, headers=auth_headers)
+    foreign_id = r.json()["id"]
+
+    r = await client.put(
+        f"/api/tournaments/{tid}/teams",
+        json={"teams": [
+            {"name": "T1", "member_ids": [ids[0], ids[1]]},
+            {"name": "T2", "member_ids": [ids[2], foreign_id]},
+        ]},
+        headers=auth_headers,
+    )
+    assert r.status_code == 200
+    r = await client.get(f"/api/tournaments/{tid}/teams")
+    members = {t["name"]: [m["display_name"] for m in t["members"]] for t in r.json()}
+    assert members == {"T1": ["A", "B"], "T2": ["C"]}
+
+
+@pytest.mark.asyncio
+async def test_format_change_clears_teams_and_bracket(client, auth_headers):
+    """Switching a team tournament to 1v1 removes its teams and bracket but keeps participants."""
+    r = await client.post("/api/tournaments", json={"name": "Format Switch", "format": "2v2"}, headers=auth_headers)
+    tid = r.json()["id"]
+    for name in ["A", "B", "C", "D"]:
+        await client.post(f"/api/tournaments/{tid}/participants", json={"display_name": name}, headers=auth_headers)
+    r = await client.post(f"/api/tournaments/{tid}/teams/regenerate", headers=auth_headers)
+    assert r.status_code == 200
+    r = await client.post(f"/api/tournaments/{tid}/bracket/generate", json={"bracket_type": "single_elim"}, headers=auth_headers)
+    assert r.status_code == 200
+
+    r = await client.patch(f"/api/tournaments/{tid}", json={"format": "1v1"}, headers=auth_headers)
+    assert r.status_code == 200
+    r = await client.patch(f"/api/tournaments/{tid}", json={"format": "2v2"}, headers=auth_headers)
+    assert r.status_code == 200
+    r = await client.get(f"/api/tournaments/{tid}/teams")
+    assert r.json() == []
+    r = await client.get(f"/api/tournaments/{tid}/bracket")
+    assert r.json() == {"error": "No bracket generated"}
+    r = await client.get(f"/api/tournaments/{tid}/participants")
+    assert len(r.json()) == 4
+
+
+@pytest.mark.asyncio
+async def test_list_participants_manual_then_discord(client, auth_headers):
+    """Participants list returns manual entries in sort order, then Discord signups."""
+    from bot.models import Player, Registration
+    from bot.models.base import async_session_factory
+
+    r = await client.post("/api/tournaments", json={"name": "Mixed Signups", "format": "1v1"}, headers=auth_headers)
+    tid = r.json()["id"]
+    for name in ["A", "B"]:
+        await client.post(f"/api/tournaments/{tid}/participants", json={"display_name": name}, headers=auth_headers)
+    async with async_session_factory() as session:
+        session.add_all([
+            Player(discord_id=111, display_name="Discord Dan"),
+            Player(discord_id=222, display_name="123456789012345678"),
+        ])
+        session.add_all([
+            Registration(tournament_id=tid, player_id=111),
+            Registration(tournament_id=tid, player_id=222),
+        ])
+        await session.commit()
+
+    r = await client.get(f"/api/tournaments/{tid}/participants")
+    assert r.status_code == 200
+    data = r.json()
+    assert [(p["source"], p["display_name"]) for p in data] == [
+        ("manual", "A"),
+        ("manual", "B"),
+        ("discord", "Discord Dan"),
+        ("discord", "Discord User"),
+    ]
+    assert data[2]["id"] == "discord:111"
+    assert data[0]["list_type"] == "participant"
+
+
+@pytest.mark.asyncio
+async def test_rename_and_remove_manual_entries(client, auth_headers):
+    """Rename/remove act only on entries of the matching list; blank names are ignored."""
+    r = await client.post("/api/tournaments", json={"name": "Rename Test", "format": "1v1"}, headers=auth_headers)
+    tid = r.json()["id"]
+    r = await client.post(f"/api/tournaments/{tid}/participants", json={"display_name": "Old"}, headers=auth_headers)
+    pid = r.json()["id"]
+    r = await client.post(f"/api/tournaments/{tid}/standby", json={"display_name": "Sub"}, headers=auth_headers)
+    sid = r.json()["id"]
+
+    r = await client.patch(f"/api/tournaments/{tid}/participants/{pid}", json={"display_name": " New "}, headers=auth_headers)
+    assert r.status_code == 200
+    assert r.json()["display_name"] == "New"
+    r = await client.patch(f"/api/tournaments/{tid}/participants/{pid}", json={"display_name": "  "}, headers=auth_headers)
+    assert r.json()["display_name"] == "New"
+    r = await client.patch(f"/api/tournaments/{tid}/participants/{sid}", json={"display_name": "X"}, headers=auth_headers)
+    assert r.status_code == 404
+    r = await client.patch(f"/api/tournaments/{tid}/standby/{sid}", json={"display_name": "Sub 2"}, headers=auth_headers)
+    assert r.json()["display_name"] == "Sub 2"
+
+    r = await client.delete(f"/api/tournaments/{tid}/standby/{pid}", headers=auth_headers)
+    assert r.status_code == 404
+    r = await client.delete(f"/api/tournaments/{tid}/standby/{sid}", headers=auth_headers)
+    assert r.status_code == 200
+    r = await client.delete(f"/api/tournaments/{tid}/standby/{sid}", headers=auth_headers)
+    assert r.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_substitute_standby(client, auth_headers):
+    """Substitute swaps a team member for a standby entry; non-members are rejected."""
+    r = await client.post("/api/tournaments", json={"name": "Sub Test", "format": "2v2"}, headers=auth_headers)
+    tid = r.json()["id"]
+    ids = []
+    for name in ["A", "B"]:
+        r = await client.post(f"/api/tournaments/{tid}/participants", json={"display_name": name}, headers=auth_headers)
+        ids.append(r.json()["id"])
+    r = await client.post(f"/api/tournaments/{tid}/standby", json={"display_name": "S"}, headers=auth_headers)
+    sid = r.json()["id"]
+    r = await client.put(
+        f"/api/tournaments/{tid}/teams",
+        json={"teams": [{"name": "T1", "member_ids": [ids[0]]}]},
+        headers=auth_headers,
+    )
+    team_id = r.json()["teams"][0]["id"]
+
+    r = await client.post(
+        f"/api/tournaments/{tid}/teams/substitute",
+        json={"team_id": team_id, "member_entry_id": ids[1], "standby_entry_id": sid},
+    )
+    assert r.status_code == 404
+    assert r.json()["detail"] == "Member not in this team"
+    r = await client.post(
+        f"/api/tournaments/{tid}/teams/substitute",
+        json={"team_id": team_id, "member_entry_id": ids[0], "standby_entry_id": sid},
+    )
+    assert r.status_code == 200
+    r = await client.get(f"/api/tournaments/{tid}/teams")
+    assert [m["display_name"] for m in r.json()[0]["members"]] == ["S"]
+
+
+@pytest.mark.asyncio
+async def test_regenerate_teams_mixed_pool(client, auth_headers):
+    """Regenerate teams places manual and Discord players; leftovers beyond full teams are skipped."""
+    from bot.models import Player, Registration
+    from bot.models.base import async_session_factory
+
+    r = await client.post("/api/tournaments", json={"name": "Regen Mixed", "format": "2v2"}, headers=auth_headers)
+    tid = r.json()["id"]
+    for name in ["A", "B", "C"]:
+        await client.post(f"/api/tournaments/{tid}/participants", json={"display_name": name}, headers=auth_headers)
+    async with async_session_factory() as session:
+        session.add_all([Player(discord_id=301, display_name="D1"), Player(discord_id=302, display_name="D2")])
+        session.add_all([
+            Registration(tournament_id=tid, player_id=301),
+            Registration(tournament_id=tid, player_id=302),
+        ])
+        await session.commit()
+
+    r = await client.post(f"/api/tournaments/{tid}/teams/regenerate", headers=auth_headers)
+    assert r.status_code == 200
+    assert r.json()["teams_created"] == 2
+    r = await client.get(f"/api/tournaments/{tid}/teams")
+    teams = r.json()
+    assert [t["name"] for t in teams] == ["Team 1", "Team 2"]
+    assert all(len(t["members"]) == 2 for t in teams)
+
+
+@pytest.mark.asyncio
+async def test_list_endpoints_etag(client, auth_headers):
+    """List endpoints send a body ETag and answer a matching If-None-Match with 304."""
+    r = await client.post("/api/tournaments", json={"name": "ETag Lists", "format": "1v1"}, headers=auth_headers)
+    tid = r.json()["id"]
+    r = await client.get(f"/api/tournaments/{tid}/participants")
+    etag = r.headers["etag"]
+    r = await client.get(f"/api/tournaments/{tid}/participants", headers={"If-None-Match": etag})
+    assert r.status_code == 304
+    assert r.content == b""
+    await client.post(f"/api/tournaments/{tid}/participants", json={"display_name": "A"}, headers=auth_headers)
+    r = await client.get(f"/api/tournaments/{tid}/participants", headers={"If-None-Match": etag})
+    assert r.status_code == 200
+    assert r.headers["etag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_list_tournaments_cache_invalidated_on_write(client, auth_headers):
+    """Cached tournament list reflects renames and archiving immediately."""
+    r = await client.post("/api/tournaments", json={"name": "Cache Me", "format": "1v1"}, headers=auth_headers)
+    tid = r.json()["id"]
+    r = await client.get("/api/tournaments")
+    assert "Cache Me" in [t["name"] for t in r.json()]
+    await client.patch(f"/api/tournaments/{tid}", json={"name": "Cache Renamed"}, headers=auth_headers)
+    r = await client.get("/api/tournaments")
+    names = [t["name"] for t in r.json()]
+    assert "Cache Renamed" in names and "Cache Me" not in names
+    await client.patch(f"/api/tournaments/{tid}", json={"archived": True}, headers=auth_headers)
+    r = await client.get("/api/tournaments")
+    assert tid not in [t["id"] for t in r.json()]
+
+
+@pytest.mark.asyncio
+async def test_bracket_regenerate_and_delete(client, auth_headers):
+    """Generate refuses a second bracket; regenerate replaces it; delete removes it."""
+    r = await client.post("/api/tournaments", json={"name": "Bracket Lifecycle", "format": "1v1"}, headers=auth_headers)
+    tid = r.json()["id"]
+    for name in ["P1", "P2", "P3", "P4"]:
+        await client.post(f"/api/tournaments/{tid}/participants", json={"display_name": name}, headers=auth_headers)
+    body = {"bracket_type": "single_elim"}
+    r = await client.post(f"/api/tournaments/{tid}/bracket/generate", json=body, headers=auth_headers)
+    assert r.status_code == 200
+    r = await client.post(f"/api/tournaments/{tid}/bracket/generate", json=body, headers=auth_headers)
+    assert r.status_code == 400
+
+    r = await client.post(f"/api/tournaments/{tid}/bracket/regenerate", json=body, headers=auth_headers)
+    assert r.status_code == 200
+    # Old matches are gone (SQLite may reuse the bracket id, so count matches)
+    r = await client.get(f"/api/tournaments/{tid}/bracket")
+    assert sum(len(ms) for ms in r.json()["rounds"].values()) == 3
+
+    r = await client.delete(f"/api/tournaments/{tid}/bracket", headers=auth_headers)
+    assert r.status_code == 200
+    r = await client.get(f"/api/tournaments/{tid}/bracket")
+    assert r.json() == {"error": "No bracket generated"}
+
+
+@pytest.mark.asyncio
+async def test_single_elim_advances_to_champion(client, auth_headers):
+    """Setting winners round by round (with a bye) advances the bracket and completes the tournament."""
+    r = await client.post("/api/tournaments", json={"name": "Advance Test", "format": "1v1"}, headers=auth_headers)
+    tid = r.json()["id"]
+    for name in ["P1", "P2", "P3", "P4", "P5"]:
+        await client.post(f"/api/tournaments/{tid}/participants", json={"display_name": name}, headers=auth_headers)
+    r = await client.post(
+        f"/api/tournaments/{tid}/bracket/generate", json={"bracket_type": "single_elim"}, headers=auth_headers
+    )
+    assert r.status_code == 200
+
+    for _ in range(10):
+        rounds = (await client.get(f"/api/tournaments/{tid}/bracket")).json()["rounds"]
+        playable = [
+            m
+            for ms in rounds.values()
+            for m in ms
+            if m["manual_entry1_id"] and m["manual_entry2_id"] and not m["winner_manual_entry_id"]
+        ]
+        if not playable:
+            break
+        m = playable[0]
+        r = await client.patch(
+            f"/api/tournaments/{tid}/bracket/matches/{m['id']}",
+            json={"winner_manual_entry_id": m["manual_entry1_id"]},
+            headers=auth_headers,
+        )
+        assert r.status_code == 200
+
+    final = rounds[max(rounds, key=int)][0]
+    assert final["winner_manual_entry_id"] is not None
+    r = await client.get("/api/tournaments")
+    assert next(t for t in r.json() if t["id"] == tid)["status"] == "completed"
+    r = await client.get("/api/winners")
+    row = next(w for w in r.json() if w["tournament_id"] == tid)
+    assert row["winner_manual_entry_id"] == final["winner_manual_entry_id"]
+    assert row["finalist_manual_entry_id"] == final["manual_entry2_id"]
+    assert row["finalist_name"] == row["finalist_display_name"]
+
+
+@pytest.mark.asyncio
+async def test_round_robin_completes_after_last_match(client, auth_headers):
+    """A round robin tournament is completed only once every match has a winner."""
+    r = await client.post("/api/tournaments", json={"name": "RR Test", "format": "1v1"}, headers=auth_headers)
+    tid = r.json()["id"]
+    for name in ["P1", "P2", "P3"]:
+        await client.post(f"/api/tournaments/{tid}/participants", json={"display_name": name}, headers=auth_headers)
+    r = await client.post(
+        f"/api/tournaments/{tid}/bracket/generate", json={"bracket_type": "round_robin"}, headers=auth_headers
+    )
+    assert r.status_code == 200
+    rounds = (await client.get(f"/api/tournaments/{tid}/bracket")).json()["rounds"]
+    matches = [m for ms in rounds.values() for m in ms if m["manual_entry1_id"] and m["manual_entry2_id"]]
+    assert len(matches) == 3
+
+    for m in matches:
+        r = await client.get("/api/tournaments")
+        assert next(t for t in r.json() if t["id"] == tid)["status"] != "completed"
+        r = await client.patch(
+            f"/api/tournaments/{tid}/bracket/matches/{m['id']}",
+            json={"winner_manual_entry_id": m["manual_entry1_id"]},
+            headers=auth_headers,
+        )
+        assert r.status_code == 200
+    r = await client.get("/api/tournaments")
+    assert next(t for t in r.json() if t["id"] == tid)["status"] == "completed"
+
+
+@pytest.mark.asyncio
+async def test_winners_query_count_is_bounded(client):
+    """The winners list runs a fixed number of statements, not one per tournament."""
+    from sqlalchemy import event
+
+    from bot.models.base import engine
+
+    statements = []
+
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _count)
+    try:
+        r = await client.get("/api/winners")
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", _count)
+    assert r.status_code == 200
+    # tournaments + champion matches + teams (with members, players, manual members) + players + manual entries
+    assert len(statements) <= 9
+
+
+@pytest.mark.asyncio
+async def test_update_match_same_winner_is_noop(client, auth_headers):
+    """Re-submitting the current winner succeeds without changing the bracket."""
+    r = await client.post("/api/tournaments", json={"name": "Idempotent Winner", "format": "1v1"}, headers=auth_headers)
+    tid = r.json()["id"]
+    for name in ["P1", "P2", "P3", "P4"]:
+        await client.post(f"/api/tournaments/{tid}/participants", json={"display_name": name}, headers=auth_headers)
+    await client.post(
+        f"/api/tournaments/{tid}/bracket/generate", json={"bracket_type": "single_elim"}, headers=auth_headers
+    )
+    match = (await client.get(f"/api/tournaments/{tid}/bracket")).json()["rounds"]["1"][0]
+    body = {"winner_manual_entry_id": match["manual_entry1_id"]}
+    url = f"/api/tournaments/{tid}/bracket/matches/{match['id']}"
+    r = await client.patch(url, json=body, headers=auth_headers)
+    assert r.status_code == 200
+    etag = (await client.get(f"/api/tournaments/{tid}/bracket")).headers["etag"]
+    r = await client.patch(url, json=body, headers=auth_headers)
+    assert r.status_code == 200
+    r = await client.get(f"/api/tournaments/{tid}/bracket", headers={"If-None-Match": etag})
+    assert r.status_code == 304
+
+
+@pytest.mark.asyncio
+async def test_swap_slots_clears_winners(client, auth_headers):
+    """Swapping entries between round-one matches moves them and clears the affected winner."""
+    r = await client.post("/api/tournaments", json={"name": "Swap Slots", "format": "1v1"}, headers=auth_headers)
+    tid = r.json()["id"]
+    for name in ["P1", "P2", "P3", "P4"]:
+        await client.post(f"/api/tournaments/{tid}/participants", json={"display_name": name}, headers=auth_headers)
+    await client.post(
+        f"/api/tournaments/{tid}/bracket/generate", json={"bracket_type": "single_elim"}, headers=auth_headers
+    )
+    m1, m2 = (await client.get(f"/api/tournaments/{tid}/bracket")).json()["rounds"]["1"]
+    await client.patch(
+        f"/api/tournaments/{tid}/bracket/matches/{m1['id']}",
+        json={"winner_manual_entry_id": m1["manual_entry1_id"]},
+        headers=auth_headers,
+    )
+    r = await client.post(
+        f"/api/tournaments/{tid}/bracket/matches/swap-slots",
+        json={"from_match_id": m1["id"], "from_slot": 1, "to_match_id": m2["id"], "to_slot": 2},
+        headers=auth_headers,
+    )
+    assert r.status_code == 200
+    new1, new2 = (await client.get(f"/api/tournaments/{tid}/bracket")).json()["rounds"]["1"]
+    assert new1["manual_entry1_id"] == m2["manual_entry2_id"]
+    assert new2["manual_entry2_id"] == m1["manual_entry1_id"]
+    assert new1["winner_manual_entry_id"] is None
+
+    r = await client.post(
+        f"/api/tournaments/{tid}/bracket/matches/swap-slots",
+        json={"from_match_id": 999999, "from_slot": 1, "to_match_id": m2["id"], "to_slot": 1},
+        headers=auth_headers,
+    )
+    assert r.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_update_teams_assigns_discord_members(client, auth_headers):
+    """PUT teams assigns Discord registrations by discord:<id> ref and ignores unknown players."""
+    from bot.models import Player, Registration
+    from bot.models.base import async_session_factory
+
+    r = await client.post("/api/tournaments", json={"name": "Teams Discord", "format": "2v2"}, headers=auth_headers)
+    tid = r.json()["id"]
+    r = await client.post(f"/api/tournaments/{tid}/participants", json={"display_name": "M"}, headers=auth_headers)
+    manual_id = r.json()["id"]
+    async with async_session_factory() as session:
+        session.add_all([Player(discord_id=401, display_name="D1"), Player(discord_id=402, display_name="D2")])
+        session.add_all([
+            Registration(tournament_id=tid, player_id=401),
+            Registration(tournament_id=tid, player_id=402),
+        ])
+        await session.commit()
+
+    r = await client.put(
+        f"/api/tournaments/{tid}/teams",
+        json={"teams": [
+            {"name": "T1", "member_ids": [manual_id, "discord:401"]},
+            {"name": "T2", "member_ids": ["discord:402", "discord:999"]},
+        ]},
+        headers=auth_headers,
+    )
+    assert r.status_code == 200
+    assert [t["name"] for t in r.json()["teams"]] == ["T1", "T2"]
+    r = await client.get(f"/api/tournaments/{tid}/teams")
+    members = {t["name"]: [m["display_name"] for m in t["members"]] for t in r.json()}
+    assert members == {"T1": ["M", "D1"], "T2": ["D2"]}
+
+
+@pytest.mark.asyncio
+async def test_move_manual_entry(client, auth_headers):
+    """Move appends the entry to the end of the target list; moving within the same list is a no-op."""
+    r = await client.post("/api/tournaments", json={"name": "Move Test", "format": "1v1"}, headers=auth_headers)
+    tid = r.json()["id"]
+    r = await client.post(f"/api/tournaments/{tid}/participants", json={"display_name": "P"}, headers=auth_headers)
+    pid = r.json()["id"]
+    for name in ["S1", "S2"]:
+        await client.post(f"/api/tournaments/{tid}/standby", json={"display_name": name}, headers=auth_headers)
+
+    url = f"/api/tournaments/{tid}/manual-entries/{pid}/move"
+    r = await client.patch(url, json={"list_type": "standby"}, headers=auth_headers)
+    assert r.status_code == 200
+    assert r.json()["list_type"] == "standby"
+    assert r.json()["sort_order"] == 2
+    r = await client.patch(url, json={"list_type": "standby"}, headers=auth_headers)
+    assert r.status_code == 200
+    assert r.json()["sort_order"] == 2
+    r = await client.get(f"/api/tournaments/{tid}/standby")
+    assert [e["display_name"] for e in r.json()] == ["S1", "S2", "P"]
+
+    r = await client.patch(
+        f"/api/tournaments/{tid}/manual-entries/999999/move", json={"list_type": "participant"}, headers=auth_headers
+    )
+    assert r.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_generate_bracket_creates_teams(client, auth_headers):
+    """Generating a team bracket builds teams from team_assignments, or from the participant list if none exist."""
+    r = await client.post("/api/tournaments", json={"name": "Auto Teams", "format": "2v2"}, headers=auth_headers)
+    tid = r.json()["id"]
+    ids = []
+    for name in ["A", "B", "C", "D", "E"]:
+        r = await client.post(f"/api/tournaments/{tid}/participants", json={"display_name": name}, headers=auth_headers)
+        ids.append(r.json()["id"])
+
+    r = await client.post(
+        f"/api/tournaments/{tid}/bracket/generate", json={"bracket_type": "single_elim"}, headers=auth_headers
+    )
+    assert r.status_code == 200
+    r = await client.get(f"/api/tournaments/{tid}/teams")
+    members = {t["name"]: [m["display_name"] for m in t["members"]] for t in r.json()}
+    assert members == {"Team 1": ["A", "B"], "Team 2": ["C", "D"]}
+
+    r = await client.post(
+        f"/api/tournaments/{tid}/bracket/regenerate",
+        json={"bracket_type": "single_elim", "team_assignments": {"X": [ids[4], ids[0]], "Y": [ids[1], ids[2]]}},
+        headers=auth_headers,
+    )
+    assert r.status_code == 200
+    r = await client.get(f"/api/tournaments/{tid}/teams")
+    members = {t["name"]: [m["display_name"] for m in t["members"]] for t in r.json()}
+    assert members["X"] == ["E", "A"] and members["Y"] == ["B", "C"]
+
+
+@pytest.mark.asyncio
+async def test_delete_tournament_removes_children(client, auth_headers):
+    """Deleting a tournament removes its teams, entries and bracket."""
+    r = await client.post("/api/tournaments", json={"name": "Doomed", "format": "2v2"}, headers=auth_headers)
+    tid = r.json()["id"]
+    for name in ["A", "B", "C", "D"]:
+        await client.post(f"/api/tournaments/{tid}/participants", json={"display_name": name}, headers=auth_headers)
+    r = await client.post(
+        f"/api/tournaments/{tid}/bracket/generate", json={"bracket_type": "single_elim"}, headers=auth_headers
+    )
+    assert r.status_code == 200
+
+    r = await client.delete(f"/api/tournaments/{tid}", headers=auth_headers)
+    assert r.status_code == 200
+    assert r.json() == {"ok": True, "deleted": "Doomed"}
+    r = await client.delete(f"/api/tournaments/{tid}", headers=auth_headers)
+    assert r.status_code == 404
+
+    from sqlalchemy import func, select
+
+    from bot.models import Bracket, Team, TournamentManualEntry
+    from bot.models.base import async_session_factory
+
+    async with async_session_factory() as session:
+        for model in (Team, TournamentManualEntry, Bracket):
+            count = await session.scalar(select(func.count()).where(model.tournament_id == tid))
+            assert count == 0, model.__name__
+
+
+@pytest.mark.asyncio
+async def test_create_user_rejects_duplicate_username(client, auth_headers):
+    """Admin can create a user once; the same username again is a 400."""
+    body = {"username": "dupe_user", "password": "secret123", "role": "user"}
+    r = await client.post("/api/auth/users", json=body, headers=auth_headers)
+    assert r.status_code == 200
+    assert r.json()["username"] == "dupe_user"
+    r = await client.post("/api/auth/users", json=body, headers=auth_headers)
+    assert r.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_post_signup_bot_unreachable(client, auth_headers, monkeypatch):
+    """Posting signup reports 503 when the bot cannot be reached."""
+    import config
+
+    monkeypatch.setattr(config, "INTERNAL_API_SECRET", "test-secret")
+    monkeypatch.setattr(config, "BOT_INTERNAL_URL", "http://127.0.0.1:9")
+    r = await client.post("/api/tournaments", json={"name": "Signup Post", "format": "1v1"}, headers=auth_headers)
+    tid = r.json()["id"]
+    r = await client.post(
+        f"/api/tournaments/{tid}/post-signup", json={"channel_id": 1, "guild_id": 2}, headers=auth_headers
+    )
+    assert r.status_code == 503
+    assert "Could not reach the Discord bot" in r.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_discord_guilds_bot_unreachable(client, auth_headers, monkeypatch):
+    """The guild and channel picker proxies report 503 when the bot cannot be reached."""
+    import config
+
+    monkeypatch.setattr(config, "INTERNAL_API_SECRET", "test-secret")
+    monkeypatch.setattr(config, "BOT_INTERNAL_URL", "http://127.0.0.1:9")
+    r = await client.get("/api/settings/discord/guilds", headers=auth_headers)
+    assert r.status_code == 503
+    r = await client.get("/api/settings/discord/guilds/123/channels", headers=auth_headers)
+    assert r.status_code == 503
+    r = await client.get("/api/settings/discord/guilds/not-a-guild/channels", headers=auth_headers)
+    assert r.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_user_role_change_and_delete_apply_immediately(client, auth_headers):
+    """Changing a user's role or deleting them takes effect on their next request."""
+    body = {"username": "mod_user", "password": "secret123", "role": "moderator"}
+    r = await client.post("/api/auth/users", json=body, headers=auth_headers)
+    assert r.status_code == 200
+    r = await client.post("/api/auth/login", json={"username": "mod_user", "password": "secret123"})
+    mod_headers = {"Authorization": f"Bearer {r.json()['access_token']}"}
+    r = await client.post("/api/tournaments", json={"name": "Mod Cup", "format": "1v1"}, headers=mod_headers)
+    tid = r.json()["id"]
+    r = await client.post(f"/api/tournaments/{tid}/participants", json={"display_name": "X"}, headers=mod_headers)
+    assert r.status_code == 200
+
+    r = await client.patch("/api/auth/users/mod_user", json={"role": "user"}, headers=auth_headers)
+    assert r.status_code == 200
+    r = await client.post(f"/api/tournaments/{tid}/participants", json={"display_name": "Y"}, headers=mod_headers)
+    assert r.status_code == 403
+
+    r = await client.delete("/api/auth/users/mod_user", headers=auth_headers)
+    assert r.status_code == 200
+    r = await client.get("/api/auth/me", headers=mod_headers)
+    assert r.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_admin_check_ignores_cached_role(client, auth_headers):
+    """A stale cached role never grants admin; role dependencies read the DB."""
+    from web import auth
+
+    body = {"username": "plain_user", "password": "secret123", "role": "user"}
+    r = await client.post("/api/auth/users", json=body, headers=auth_headers)
+    assert r.status_code == 200
+    r = await client.post("/api/auth/login", json={"username": "plain_user", "password": "secret123"})
+    headers = {"Authorization": f"Bearer {r.json()['access_token']}"}
+    r = await client.get("/api/auth/me", headers=headers)
+    assert r.json()["role"] == "user"
+    expires, snapshot = auth._user_cache["plain_user"]
+    auth._user_cache["plain_user"] = (expires, snapshot._replace(role="admin"))
+    r = await client.get("/api/auth/users", headers=headers)
+    assert r.status_code == 403
+
+
+def test_decode_token_rechecks_expiry(monkeypatch):
+    """A token verified once is still rejected after it expires; cached payloads are not shared."""
+    import time
+
+    import jwt
+
+    from web import auth
+
+    token = auth.create_access_token("admin", "admin")
+    assert auth.decode_token(token)["sub"] == "admin"
+    later = time.time() + 400 * 86400
+    monkeypatch.setattr(auth.time, "time", lambda: later)
+    assert auth.decode_token(token) is None
+    monkeypatch.undo()
+
+    payload = auth.decode_token(token)
+    payload["role"] = "tampered"
+    assert auth.decode_token(token)["role"] == "admin"
+    future = jwt.encode({"sub": "admin", "nbf": time.time() + 3600}, auth._JWT_KEY, algorithm=auth.config.JWT_ALGORITHM)
+    assert auth.decode_token(future) is None
@@ -5,16 +5,19 @@ from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import exists, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 import config
 from bot.models import User
-from bot.models.base import async_session_factory
+from bot.models.base import get_async_session
 from web.auth import (
+    CachedUser,
     create_access_token,
     get_current_user,
     get_user_by_username,
     hash_password,
+    invalidate_user,
     require_admin_user,
     require_user,
     verify_password,
@@ -47,9 +50,9 @@ class CreateUserRequest(BaseModel):
 
 
 @router.post("/login", response_model=LoginResponse)
-async def login(body: LoginRequest):
+async def login(body: LoginRequest, session: AsyncSession = Depends(get_async_session)):
     """Authenticate and return JWT."""
-    user = await get_user_by_username(body.username)
+    user = await get_user_by_username(body.username, session)
     if not user:
         # Bootstrap: if INITIAL_ADMIN_PASSWORD is set and matches, create admin
         if (
@@ -57,17 +60,15 @@ async def login(body: LoginRequest):
             and body.username == config.INITIAL_ADMIN_USERNAME
             and body.password == config.INITIAL_ADMIN_PASSWORD
         ):
-            async with async_session_factory() as session:
-                user = User(
-                    username=config.INITIAL_ADMIN_USERNAME,
-                    password_hash=hash_password(config.INITIAL_ADMIN_PASSWORD),
-                    role="admin",
-                )
-                session.add(user)
-                await session.commit()
-                await session.refresh(user)
-                token = create_access_token(user.username, user.role)
-                return LoginResponse(access_token=token, username=user.username, role=user.role)
+            user = User(
+                username=config.INITIAL_ADMIN_USERNAME,
+                password_hash=hash_password(config.INITIAL_ADMIN_PASSWORD),
+                role="admin",
+            )
+            session.add(user)
+            await session.commit()
+            token = create_access_token(user.username, user.role)
+            return LoginResponse(access_token=token, username=user.username, role=user.role)
         raise HTTPException(status_code=401, detail="Invalid username or password")
     if not verify_password(body.password, user.password_hash):
         raise HTTPException(status_code=401, detail="Invalid username or password")
@@ -76,13 +77,13 @@ async def login(body: LoginRequest):
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_me(user: User = Depends(require_user)):
+async def get_me(user: CachedUser = Depends(require_user)):
     """Get current authenticated user."""
     return UserResponse(username=user.username, role=user.role)
 
 
 @router.get("/me/optional")
-async def get_me_optional(user: Optional[User] = Depends(get_current_user)):
+async def get_me_optional(user: Optional[CachedUser] = Depends(get_current_user)):
     """Get current user if logged in, else null. For frontend auth check."""
     if not user:
         return None
@@ -90,32 +91,34 @@ async def get_me_optional(user: Optional[User] = Depends(get_current_user)):
 
 
 @router.get("/users", response_model=list[UserResponse])
-async def list_users(admin: User = Depends(require_admin_user)):
+async def list_users(
+    admin: User = Depends(require_admin_user), session: AsyncSession = Depends(get_async_session)
+):
     """List all users (admin only)."""
-    async with async_session_factory() as session:
-        result = await session.execute(select(User).order_by(User.username))
-        users = result.scalars().all()
-        return [UserResponse(username=u.username, role=u.role) for u in users]
+    result = await session.execute(select(User).order_by(User.username))
+    users = result.scalars().all()
+    return [UserResponse(username=u.username, role=u.role) for u in users]
 
 
 @router.post("/users", response_model=UserResponse)
-async def create_user(body: CreateUserRequest, admin: User = Depends(require_admin_user)):
+async def create_user(
+    body: CreateUserRequest,
+    admin: User = Depends(require_admin_user),
+    session: AsyncSession = Depends(get_async_session),
+):
     """Create a new user (admin only)."""
     if body.role not in ("user", "moderator", "admin"):
         raise HTTPException(400, "Invalid role")
-    async with async_session_factory() as session:
-        existing = await session.execute(select(User).where(User.username == body.username))
-        if existing.scalar_one_or_none():
-            raise HTTPException(400, "Username already exists")
-        user = User(
-            username=body.username,
-            password_hash=hash_password(body.password),
-            role=body.role,
-        )
-        session.add(user)
-        await session.commit()
-        await session.refresh(user)
-        return UserResponse(username=user.username, role=user.role)
+    if await session.scalar(select(exists().where(User.username == body.username))):
+        raise HTTPException(400, "Username already exists")
+    user = User(
+        username=body.username,
+        password_hash=hash_password(body.password),
+        role=body.role,
+    )
+    session.add(user)
+    await session.commit()
+    return UserResponse(username=user.username, role=user.role)
 
 
 class UpdateUserRequest(BaseModel):
@@ -124,33 +127,40 @@ class UpdateUserRequest(BaseModel):
 
 
 @router.patch("/users/{username}")
-async def update_user(username: str, body: UpdateUserRequest, admin: User = Depends(require_admin_user)):
+async def update_user(
+    username: str,
+    body: UpdateUserRequest,
+    admin: User = Depends(require_admin_user),
+    session: AsyncSession = Depends(get_async_session),
+):
     """Update user password or role (admin only)."""
-    async with async_session_factory() as session:
-        result = await session.execute(select(User).where(User.username == username))
-        user = result.scalar_one_or_none()
-        if not user:
-            raise HTTPException(404, "User not found")
-        if body.password is not None:
-            user.password_hash = hash_password(body.password)
-        if body.role is not None:
-            if body.role not in ("user", "moderator", "admin"):
-                raise HTTPException(400, "Invalid role")
-            user.role = body.role
-        await session.commit()
-        return {"ok": True}
+    user = await get_user_by_username(username, session)
+    if not user:
+        raise HTTPException(404, "User not found")
+    if body.password is not None:
+        user.password_hash = hash_password(body.password)
+    if body.role is not None:
+        if body.role not in ("user", "moderator", "admin"):
+            raise HTTPException(400, "Invalid role")
+        user.role = body.role
+    await session.commit()
+    invalidate_user(username)
+    return {"ok": True}
 
 
 @router.delete("/users/{username}")
-async def delete_user(username: str, admin: User = Depends(require_admin_user)):
+async def delete_user(
+    username: str,
+    admin: User = Depends(require_admin_user),
+    session: AsyncSession = Depends(get_async_session),
+):
     """Delete a user (admin only). Cannot delete self."""
     if username == admin.username:
         raise HTTPException(400, "Cannot delete your own account")
-    async with async_session_factory() as session:
-        result = await session.execute(select(User).where(User.username == username))
-        user = result.scalar_one_or_none()
-        if not user:
-            raise HTTPException(404, "User not found")
-        await session.delete(user)
-        await session.commit()
-        return {"ok": True}
+    user = await get_user_by_username(username, session)
+    if not user:
+        raise HTTPException(404, "User not found")
+    await session.delete(user)
+    await session.commit()
+    invalidate_user(username)
+    return {"ok": True}
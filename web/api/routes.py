@@ -3,20 +3,21 @@ from __future__ import annotations
 
 import logging
 import random
+import time
 from datetime import datetime, timezone
 from typing import Optional
 
 import httpx
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request
 
 import config
-from pydantic import BaseModel, ConfigDict, field_validator
+from pydantic import BaseModel, ConfigDict, TypeAdapter, field_validator
 
 from bot.models import User
 from web.auth import require_moderator_user
-from sqlalchemy import delete, func, or_, select, update
+from sqlalchemy import Boolean, Row, and_, bindparam, case, delete, exists, func, insert, lambda_stmt, literal, null, or_, select, union_all, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
 from bot.models import (
     Bracket,
@@ -28,29 +29,73 @@ from bot.models import (
     TeamManualMember,
     Tournament,
     TournamentManualEntry,
+    TournamentSignupMessage,
+)
+from bot.models.base import get_async_session
+from bot.services.bracket_gen import (
+    MATCH_HAS_WINNER,
+    advance_rounds_until_incomplete,
+    advance_winner_to_parent,
+    clear_match_winner,
+    create_manual_bracket,
+    load_match_with_bracket,
+    round_just_completed,
+    swap_match_winner,
+    swap_slots,
 )
-from bot.models.base import async_session_factory
 
-from web.api.utils import player_display_name
+from web.api.utils import display_name_or_default, http_client, json_response, player_display_name
 from bot.models.tournament import parse_format_players
 
 router = APIRouter(prefix="/api", tags=["tournaments"])
 
 
+# Short-lived cache for the polled tournament list. Writes in this module invalidate it; changes
+# made elsewhere (e.g. by the bot) show up once the TTL expires.
+_CACHE_TTL = 5.0
+_tournament_list_cache: dict[bool, tuple[float, list[dict]]] = {}
+# player_id -> monotonic time until which the bot's last name refresh is considered fresh
+_NAME_REFRESH_TTL = 60.0
+_NAME_REFRESH_MAX = 4096
+_name_refresh_until: dict[int, float] = {}
+
+
+async def _get_tournament_format(session: AsyncSession, tournament_id: int) -> str | None:
+    """Tournament format, or None if it doesn't exist. Not cached: callers use it as the existence check."""
+    result = await session.execute(select(Tournament.format).where(Tournament.id == tournament_id))
+    return result.scalar_one_or_none()
+
+
+def _invalidate_tournament_cache() -> None:
+    """Drop the cached tournament list after a write."""
+    _tournament_list_cache.clear()
+
+
 async def _refresh_player_names_from_discord(player_ids: list[int]) -> None:
-    """Ask the bot to refresh display_name from Discord for these player_ids. No-op if bot unreachable."""
+    """Ask the bot to refresh display_name from Discord for these player_ids. No-op if bot unreachable.
+
+    Players refreshed within the last _NAME_REFRESH_TTL seconds are skipped.
+    """
     if not player_ids or not config.INTERNAL_API_SECRET:
         return
+    now = time.monotonic()
+    player_ids = [pid for pid in player_ids if _name_refresh_until.get(pid, 0.0) <= now]
+    if not player_ids:
+        return
     url = f"{config.BOT_INTERNAL_URL.rstrip('/')}/internal/refresh-players"
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            await client.post(
-                url,
-                json={"player_ids": player_ids},
-                headers={"Authorization": f"Bearer {config.INTERNAL_API_SECRET}"},
-            )
+        r = await http_client().post(
+            url,
+            json={"player_ids": player_ids},
+            headers={"Authorization": f"Bearer {config.INTERNAL_API_SECRET}"},
+        )
     except Exception:
-        pass  # Best-effort; don't fail the request
+        return  # Best-effort; don't fail the request
+    if r.status_code == 200:
+        if len(_name_refresh_until) + len(player_ids) > _NAME_REFRESH_MAX:
+            _name_refresh_until.clear()
+        until = now + _NAME_REFRESH_TTL
+        _name_refresh_until.update(dict.fromkeys(player_ids, until))
 
 
 async def _get_discord_bracket_channel(session, t) -> tuple[int | None, int | None]:
@@ -100,14 +145,13 @@ async def _post_bracket_to_discord(session, tournament_id: int, t) -> None:
     if not (guild_id and channel_id):
         return
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            r = await client.post(
-                f"{config.BOT_INTERNAL_URL.rstrip('/')}/internal/post-bracket",
-                json={"tournament_id": tournament_id, "channel_id": channel_id, "guild_id": guild_id},
-                headers={"Authorization": f"Bearer {config.INTERNAL_API_SECRET}"},
-            )
-            if r.status_code != 200:
-                logging.getLogger("octane").warning("post-bracket failed: %s", r.text)
+        r = await http_client().post(
+            f"{config.BOT_INTERNAL_URL.rstrip('/')}/internal/post-bracket",
+            json={"tournament_id": tournament_id, "channel_id": channel_id, "guild_id": guild_id},
+            headers={"Authorization": f"Bearer {config.INTERNAL_API_SECRET}"},
+        )
+        if r.status_code != 200:
+            logging.getLogger("octane").warning("post-bracket failed: %s", r.text)
     except Exception as e:
         logging.getLogger("octane").warning("Failed to post bracket to Discord: %s", e)
 
@@ -120,14 +164,13 @@ async def _post_teams_to_discord(session, tournament_id: int, t) -> None:
     if not (guild_id and channel_id):
         return
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            r = await client.post(
-                f"{config.BOT_INTERNAL_URL.rstrip('/')}/internal/post-teams",
-                json={"tournament_id": tournament_id, "channel_id": channel_id, "guild_id": guild_id},
-                headers={"Authorization": f"Bearer {config.INTERNAL_API_SECRET}"},
-            )
-            if r.status_code != 200:
-                logging.getLogger("octane").warning("post-teams failed: %s", r.text)
+        r = await http_client().post(
+            f"{config.BOT_INTERNAL_URL.rstrip('/')}/internal/post-teams",
+            json={"tournament_id": tournament_id, "channel_id": channel_id, "guild_id": guild_id},
+            headers={"Authorization": f"Bearer {config.INTERNAL_API_SECRET}"},
+        )
+        if r.status_code != 200:
+            logging.getLogger("octane").warning("post-teams failed: %s", r.text)
     except Exception as e:
         logging.getLogger("octane").warning("Failed to post teams to Discord: %s", e)
 
@@ -161,6 +204,10 @@ class DiscordRegistrationResponse(BaseModel):
     source: str = "discord"
 
 
+_MANUAL_LIST_ADAPTER = TypeAdapter(list[ManualEntryResponse])
+_PARTICIPANT_LIST_ADAPTER = TypeAdapter(list[ManualEntryResponse | DiscordRegistrationResponse])
+
+
 class ManualEntryReorder(BaseModel):
     entry_ids: list[int]
 
@@ -171,15 +218,10 @@ class ManualEntryMove(BaseModel):
 
 def _coerce_id(v):
     """Coerce int or str to int (handles Discord IDs sent as string for JS precision)."""
-    if v is None:
-        return None
-    if isinstance(v, int):
+    if v is None or type(v) is int:
         return v
-    if isinstance(v, str):
-        try:
-            return int(v)
-        except ValueError:
-            return None
+    if type(v) is str:
+        return int(v) if v.isascii() and v.isdigit() else None
     return None
 
 
@@ -200,6 +242,10 @@ class BracketMatchUpdate(BaseModel):
         return _coerce_id(v)
 
 
+_WINNER_KEYS = frozenset({"winner_team_id", "winner_player_id", "winner_manual_entry_id"})
+_MATCH_COLUMNS = frozenset(c.name for c in BracketMatch.__table__.columns)
+
+
 class GenerateBracketRequest(BaseModel):
     use_manual_order: bool = True  # Use manual list order; if False, use MMR if available
     bracket_type: str = "single_elim"  # single_elim, double_elim, or round_robin
@@ -222,499 +268,698 @@ class TeamsBulkUpdate(BaseModel):
     teams: list[TeamUpdate]
 
 
+async def _tear_down_teams_and_bracket(session: AsyncSession, tournament_id: int) -> None:
+    """Delete a tournament's teams and bracket with bulk DELETEs.
+
+    Team assignments are cleared first so Discord signups stay registered. SQLite runs without
+    FK enforcement, so child rows (team members, matches) are deleted explicitly.
+    """
+    await session.execute(
+        update(Registration)
+        .where(Registration.tournament_id == tournament_id)
+        .values(team_id=None)
+        .execution_options(synchronize_session=False)
+    )
+    team_ids = select(Team.id).where(Team.tournament_id == tournament_id)
+    await session.execute(
+        delete(TeamManualMember).where(TeamManualMember.team_id.in_(team_ids)).execution_options(synchronize_session=False)
+    )
+    await session.execute(delete(Team).where(Team.tournament_id == tournament_id).execution_options(synchronize_session=False))
+    await _delete_bracket(session, tournament_id)
+
+
+async def _delete_bracket(session: AsyncSession, tournament_id: int) -> int:
+    """Delete a tournament's bracket and its matches with bulk DELETEs. Returns the number of brackets removed."""
+    bracket_ids = select(Bracket.id).where(Bracket.tournament_id == tournament_id)
+    await session.execute(
+        delete(BracketMatch).where(BracketMatch.bracket_id.in_(bracket_ids)).execution_options(synchronize_session=False)
+    )
+    result = await session.execute(
+        delete(Bracket).where(Bracket.tournament_id == tournament_id).execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+
 # --- Participants ---
 
 
-@router.get("/tournaments/{tournament_id}/participants")
-async def list_participants(tournament_id: int):
-    """List participants: manual entries first, then Discord signups (reaction or /tournament register). Includes all Discord users for team format so they appear in Players/Teams view."""
-    async with async_session_factory() as session:
-        t = await session.get(Tournament, tournament_id)
-        if not t:
-            raise HTTPException(404, "Tournament not found")
-        # Refresh Discord display names before loading (bot fetches from Discord API)
-        regs_query = select(Registration.player_id).where(Registration.tournament_id == tournament_id)
-        if t.format == "1v1":
-            regs_query = regs_query.where(Registration.team_id.is_(None))
-        regs_pre = await session.execute(regs_query)
-        player_ids = list({r[0] for r in regs_pre.fetchall()})
-        await _refresh_player_names_from_discord(player_ids)
-        # Manual participants
-        result = await session.execute(
-            select(TournamentManualEntry)
-            .where(
-                TournamentManualEntry.tournament_id == tournament_id,
-                TournamentManualEntry.list_type == "participant",
-            )
-            .order_by(TournamentManualEntry.sort_order, TournamentManualEntry.id)
+def _next_sort_order(tournament_id: int, list_type: str):
+    """Scalar subquery for the sort_order that appends to a tournament's manual list (0 if empty)."""
+    return (
+        select(func.coalesce(func.max(TournamentManualEntry.sort_order), -1) + 1)
+        .where(
+            TournamentManualEntry.tournament_id == tournament_id,
+            TournamentManualEntry.list_type == list_type,
         )
-        manual = [ManualEntryResponse.model_validate(e) for e in result.scalars().all()]
-        # Discord registrations (all of them for team format; unassigned only for 1v1)
-        discord_list = []
-        regs_query = select(Registration).where(Registration.tournament_id == tournament_id)
-        if t.format == "1v1":
-            regs_query = regs_query.where(Registration.team_id.is_(None))
-        regs_result = await session.execute(
-            regs_query.options(selectinload(Registration.player))
+        .scalar_subquery()
+    )
+
+
+async def _append_manual_entry(
+    session: AsyncSession, tournament_id: int, body: ManualEntryCreate, list_type: str
+) -> TournamentManualEntry:
+    """Insert a manual entry at the end of its list; sort_order and the returned row come from the same INSERT."""
+    result = await session.execute(
+        insert(TournamentManualEntry)
+        .values(
+            tournament_id=tournament_id,
+            display_name=body.display_name,
+            epic_id=body.epic_id,
+            list_type=list_type,
+            original_list_type=list_type,
+            sort_order=_next_sort_order(tournament_id, list_type),
         )
-        for reg in regs_result.scalars().all():
-            discord_list.append(
+        .returning(TournamentManualEntry)
+    )
+    return result.scalar_one()
+
+
+async def _delete_manual_entry(
+    session: AsyncSession, tournament_id: int, entry_id: int, list_type: str, not_found: str
+) -> None:
+    """Delete a manual entry (and its team memberships) if it belongs to this tournament/list; else 404."""
+    result = await session.execute(
+        delete(TournamentManualEntry).where(
+            TournamentManualEntry.id == entry_id,
+            TournamentManualEntry.tournament_id == tournament_id,
+            TournamentManualEntry.list_type == list_type,
+        )
+    )
+    if result.rowcount == 0:
+        raise HTTPException(404, not_found)
+    await session.execute(delete(TeamManualMember).where(TeamManualMember.manual_entry_id == entry_id))
+
+
+async def _reorder_manual_entries(session: AsyncSession, tournament_id: int, list_type: str, entry_ids: list[int]) -> None:
+    """Set sort_order from position in entry_ids in a single UPDATE. Ids outside this tournament/list are ignored."""
+    order_map = {eid: i for i, eid in enumerate(entry_ids)}
+    if not order_map:
+        return
+    await session.execute(
+        update(TournamentManualEntry)
+        .where(
+            TournamentManualEntry.tournament_id == tournament_id,
+            TournamentManualEntry.list_type == list_type,
+            TournamentManualEntry.id.in_(order_map),
+        )
+        .values(sort_order=case(order_map, value=TournamentManualEntry.id))
+    )
+
+
+def _participant_rows_select():
+    """Manual participants and Discord registrations in one UNION ALL; manual first, then Discord."""
+    manual_q = select(
+        literal(0).label("grp"),
+        TournamentManualEntry.id,
+        TournamentManualEntry.display_name,
+        TournamentManualEntry.epic_id,
+        TournamentManualEntry.list_type,
+        TournamentManualEntry.original_list_type,
+        TournamentManualEntry.sort_order,
+    ).where(
+        TournamentManualEntry.tournament_id == bindparam("tid"),
+        TournamentManualEntry.list_type == "participant",
+    )
+    discord_q = (
+        select(
+            literal(1).label("grp"),
+            Registration.player_id,
+            Player.display_name,
+            null(),
+            null(),
+            null(),
+            Registration.id,
+        )
+        .outerjoin(Player, Player.discord_id == Registration.player_id)
+        .where(
+            Registration.tournament_id == bindparam("tid"),
+            or_(Registration.team_id.is_(None), bindparam("include_assigned", type_=Boolean())),
+        )
+    )
+    combined = union_all(manual_q, discord_q).subquery()
+    return select(combined).order_by(combined.c.grp, combined.c.sort_order, combined.c.id)
+
+
+# Hot read statements; lambda_stmt caches construction and compiled SQL across requests
+_PARTICIPANT_ROWS_STMT = lambda_stmt(_participant_rows_select)
+_PARTICIPANT_PLAYER_IDS_STMT = lambda_stmt(
+    lambda: select(Registration.player_id).where(
+        Registration.tournament_id == bindparam("tid"),
+        or_(Registration.team_id.is_(None), bindparam("include_assigned", type_=Boolean())),
+    )
+)
+
+
+@router.get("/tournaments/{tournament_id}/participants")
+async def list_participants(
+    tournament_id: int,
+    request: Request,
+    background_tasks: BackgroundTasks,
+    refresh: bool = False,
+    session: AsyncSession = Depends(get_async_session),
+):
+    """List participants: manual entries first, then Discord signups (reaction or /tournament register). Includes all Discord users for team format so they appear in Players/Teams view.
+
+    Discord display names are refreshed after the response; pass ?refresh=1 to wait for fresh names first."""
+    fmt = await _get_tournament_format(session, tournament_id)
+    if fmt is None:
+        raise HTTPException(404, "Tournament not found")
+    # Discord registrations: all of them for team format; unassigned only for 1v1
+    params = {"tid": tournament_id, "include_assigned": fmt != "1v1"}
+    # Refresh Discord display names (bot fetches from Discord API). By default this runs after the
+    # response, so the player ids come from the rows below instead of a separate query.
+    if refresh:
+        regs_pre = await session.execute(_PARTICIPANT_PLAYER_IDS_STMT, params)
+        await _refresh_player_names_from_discord(list({r[0] for r in regs_pre.fetchall()}))
+    rows = await session.stream(_PARTICIPANT_ROWS_STMT, params)
+    participants: list[ManualEntryResponse | DiscordRegistrationResponse] = []
+    player_ids: list[int] = []
+    async for grp, row_id, name, epic_id, list_type, original_list_type, sort_order in rows:
+        if grp == 0:
+            participants.append(
+                ManualEntryResponse(
+                    id=row_id,
+                    display_name=name,
+                    epic_id=epic_id,
+                    list_type=list_type,
+                    original_list_type=original_list_type,
+                    sort_order=sort_order,
+                )
+            )
+        else:
+            player_ids.append(row_id)
+            participants.append(
                 DiscordRegistrationResponse(
-                    id=f"discord:{reg.player_id}",
-                    display_name=player_display_name(reg.player, reg.player_id),
-                    player_id=reg.player_id,
+                    id=f"discord:{row_id}",
+                    display_name=display_name_or_default(name),
+                    player_id=row_id,
                 )
             )
-        # Manual first, then Discord
-        return manual + discord_list
+    if not refresh:
+        background_tasks.add_task(_refresh_player_names_from_discord, player_ids)
+    return json_response(participants, _PARTICIPANT_LIST_ADAPTER, request)
 
 
 @router.post("/tournaments/{tournament_id}/participants")
-async def add_participant(tournament_id: int, body: ManualEntryCreate, user: User = Depends(require_moderator_user)):
+async def add_participant(
+    tournament_id: int, body: ManualEntryCreate,
+    user: User = Depends(require_moderator_user),
+    session: AsyncSession = Depends(get_async_session),
+):
     """Add a manual participant."""
-    async with async_session_factory() as session:
-        t = await session.get(Tournament, tournament_id)
-        if not t:
-            raise HTTPException(404, "Tournament not found")
-        result = await session.execute(
-            select(TournamentManualEntry)
-            .where(
-                TournamentManualEntry.tournament_id == tournament_id,
-                TournamentManualEntry.list_type == "participant",
-            )
-        )
-        max_order = max((e.sort_order for e in result.scalars().all()), default=-1)
-        entry = TournamentManualEntry(
-            tournament_id=tournament_id,
-            display_name=body.display_name,
-            epic_id=body.epic_id,
-            list_type="participant",
-            original_list_type="participant",
-            sort_order=max_order + 1,
-        )
-        session.add(entry)
-        await session.commit()
-        await session.refresh(entry)
-        return ManualEntryResponse.model_validate(entry)
+    if await _get_tournament_format(session, tournament_id) is None:
+        raise HTTPException(404, "Tournament not found")
+    entry = await _append_manual_entry(session, tournament_id, body, "participant")
+    await session.commit()
+    return ManualEntryResponse.model_validate(entry)
 
 
-@router.patch("/tournaments/{tournament_id}/participants/{entry_id}")
-async def rename_participant(tournament_id: int, entry_id: int, body: ManualEntryCreate, user: User = Depends(require_moderator_user)):
+@router.patch("/tournaments/{tournament_id}/participants/{entry_id:int}")
+async def rename_participant(
+    tournament_id: int, entry_id: int, body: ManualEntryCreate,
+    user: User = Depends(require_moderator_user),
+    session: AsyncSession = Depends(get_async_session),
+):
     """Rename a manual participant."""
-    async with async_session_factory() as session:
-        entry = await session.get(TournamentManualEntry, entry_id)
-        if not entry or entry.tournament_id != tournament_id or entry.list_type != "participant":
-            raise HTTPException(404, "Participant not found")
-        entry.display_name = body.display_name.strip() or entry.display_name
-        await session.commit()
-        await session.refresh(entry)
-        return ManualEntryResponse.model_validate(entry)
+    result = await session.execute(
+        update(TournamentManualEntry)
+        .where(
+            TournamentManualEntry.id == entry_id,
+            TournamentManualEntry.tournament_id == tournament_id,
+            TournamentManualEntry.list_type == "participant",
+        )
+        .values(display_name=body.display_name.strip() or TournamentManualEntry.display_name)
+        .returning(TournamentManualEntry)
+    )
+    entry = result.scalar_one_or_none()
+    if not entry:
+        raise HTTPException(404, "Participant not found")
+    await session.commit()
+    return ManualEntryResponse.model_validate(entry)
 
 
 @router.delete("/tournaments/{tournament_id}/participants/{entry_id}")
-async def remove_participant(tournament_id: int, entry_id: int, user: User = Depends(require_moderator_user)):
+async def remove_participant(
+    tournament_id: int, entry_id: int,
+    user: User = Depends(require_moderator_user),
+    session: AsyncSession = Depends(get_async_session),
+):
     """Remove a manual participant."""
-    async with async_session_factory() as session:
-        entry = await session.get(TournamentManualEntry, entry_id)
-        if not entry or entry.tournament_id != tournament_id or entry.list_type != "participant":
-            raise HTTPException(404, "Participant not found")
-        await session.delete(entry)
-        await session.commit()
-        return {"ok": True}
+    await _delete_manual_entry(session, tournament_id, entry_id, "participant", "Participant not found")
+    await session.commit()
+    return {"ok": True}
 
 
 @router.patch("/tournaments/{tournament_id}/participants/reorder")
-async def reorder_participants(tournament_id: int, body: ManualEntryReorder, user: User = Depends(require_moderator_user)):
+async def reorder_participants(
+    tournament_id: int, body: ManualEntryReorder,
+    user: User = Depends(require_moderator_user),
+    session: AsyncSession = Depends(get_async_session),
+):
     """Reorder participants by ID list (manual entries only)."""
-    async with async_session_factory() as session:
-        for i, eid in enumerate(body.entry_ids):
-            if not isinstance(eid, int):
-                continue
-            entry = await session.get(TournamentManualEntry, eid)
-            if entry and entry.tournament_id == tournament_id and entry.list_type == "participant":
-                entry.sort_order = i
-        await session.commit()
-        return {"ok": True}
+    await _reorder_manual_entries(session, tournament_id, "participant", body.entry_ids)
+    await session.commit()
+    return {"ok": True}
 
 
 @router.delete("/tournaments/{tournament_id}/registrations/{player_id}")
-async def remove_registration(tournament_id: int, player_id: int, user: User = Depends(require_moderator_user)):
+async def remove_registration(
+    tournament_id: int, player_id: int,
+    user: User = Depends(require_moderator_user),
+    session: AsyncSession = Depends(get_async_session),
+):
     """Remove a Discord registration. If on a team, unassigns to participants; otherwise fully removes."""
-    async with async_session_factory() as session:
-        result = await session.execute(
-            select(Registration).where(
-                Registration.tournament_id == tournament_id,
-                Registration.player_id == player_id,
-            )
+    result = await session.execute(
+        select(Registration).where(
+            Registration.tournament_id == tournament_id,
+            Registration.player_id == player_id,
         )
-        reg = result.scalar_one_or_none()
-        if not reg:
-            raise HTTPException(404, "Registration not found")
-        if reg.team_id:
-            reg.team_id = None
-        else:
-            await session.delete(reg)
-        await session.commit()
-        return {"ok": True}
+    )
+    reg = result.scalar_one_or_none()
+    if not reg:
+        raise HTTPException(404, "Registration not found")
+    if reg.team_id:
+        reg.team_id = None
+    else:
+        await session.delete(reg)
+    await session.commit()
+    return {"ok": True}
 
 
 # --- Standby ---
 
 
-@router.get("/tournaments/{tournament_id}/standby")
-async def list_standby(tournament_id: int):
-    """List standby/seat filler entries. Excludes those currently in a team to avoid duplicate listing."""
-    async with async_session_factory() as session:
-        t = await session.get(Tournament, tournament_id)
-        if not t:
-            raise HTTPException(404, "Tournament not found")
-        # Exclude manual entries that are in a team - they're participating, not in standby pool
-        in_team_subq = (
+# Originally-standby entries, excluding those currently in a team - they're participating,
+# not in the standby pool (avoids participant+standby duplicate)
+_STANDBY_STMT = lambda_stmt(
+    lambda: select(TournamentManualEntry)
+    .where(
+        TournamentManualEntry.tournament_id == bindparam("tid"),
+        TournamentManualEntry.effective_original_list_type == "standby",
+        TournamentManualEntry.id.not_in(
             select(TeamManualMember.manual_entry_id)
             .join(Team, Team.id == TeamManualMember.team_id)
-            .where(Team.tournament_id == tournament_id)
-        )
-        result = await session.execute(
-            select(TournamentManualEntry)
-            .where(
-                TournamentManualEntry.tournament_id == tournament_id,
-                # Show originally standby, but exclude those currently in a team (avoids participant+standby duplicate)
-                (
-                    (TournamentManualEntry.original_list_type == "standby")
-                    | (
-                        (TournamentManualEntry.original_list_type.is_(None))
-                        & (TournamentManualEntry.list_type == "standby")
-                    )
-                ),
-                TournamentManualEntry.id.not_in(in_team_subq),
-            )
-            .order_by(TournamentManualEntry.sort_order, TournamentManualEntry.id)
-        )
-        entries = result.scalars().all()
-        return [ManualEntryResponse.model_validate(e) for e in entries]
+            .where(Team.tournament_id == bindparam("tid"))
+        ),
+    )
+    .order_by(TournamentManualEntry.sort_order, TournamentManualEntry.id)
+)
+
+
+@router.get("/tournaments/{tournament_id}/standby")
+async def list_standby(tournament_id: int, request: Request, session: AsyncSession = Depends(get_async_session)):
+    """List standby/seat filler entries. Excludes those currently in a team to avoid duplicate listing."""
+    if await _get_tournament_format(session, tournament_id) is None:
+        raise HTTPException(404, "Tournament not found")
+    entries = await session.stream_scalars(_STANDBY_STMT, {"tid": tournament_id})
+    rows = [e async for e in entries]
+    return json_response(_MANUAL_LIST_ADAPTER.validate_python(rows, from_attributes=True), _MANUAL_LIST_ADAPTER, request)
 
 
 @router.post("/tournaments/{tournament_id}/standby")
-async def add_standby(tournament_id: int, body: ManualEntryCreate, user: User = Depends(require_moderator_user)):
+async def add_standby(
+    tournament_id: int, body: ManualEntryCreate,
+    user: User = Depends(require_moderator_user),
+    session: AsyncSession = Depends(get_async_session),
+):
     """Add a standby entry."""
-    async with async_session_factory() as session:
-        t = await session.get(Tournament, tournament_id)
-        if not t:
-            raise HTTPException(404, "Tournament not found")
-        result = await session.execute(
-            select(TournamentManualEntry)
-            .where(
-                TournamentManualEntry.tournament_id == tournament_id,
-                TournamentManualEntry.list_type == "standby",
-            )
-        )
-        max_order = max((e.sort_order for e in result.scalars().all()), default=-1)
-        entry = TournamentManualEntry(
-            tournament_id=tournament_id,
-            display_name=body.display_name,
-            epic_id=body.epic_id,
-            list_type="standby",
-            original_list_type="standby",
-            sort_order=max_order + 1,
-        )
-        session.add(entry)
-        await session.commit()
-        await session.refresh(entry)
-        return ManualEntryResponse.model_validate(entry)
+    if await _get_tournament_format(session, tournament_id) is None:
+        raise HTTPException(404, "Tournament not found")
+    entry = await _append_manual_entry(session, tournament_id, body, "standby")
+    await session.commit()
+    return ManualEntryResponse.model_validate(entry)
 
 
-@router.patch("/tournaments/{tournament_id}/standby/{entry_id}")
-async def rename_standby(tournament_id: int, entry_id: int, body: ManualEntryCreate, user: User = Depends(require_moderator_user)):
+@router.patch("/tournaments/{tournament_id}/standby/{entry_id:int}")
+async def rename_standby(
+    tournament_id: int, entry_id: int, body: ManualEntryCreate,
+    user: User = Depends(require_moderator_user),
+    session: AsyncSession = Depends(get_async_session),
+):
     """Rename a standby entry (including those substituted in)."""
-    async with async_session_factory() as session:
-        entry = await session.get(TournamentManualEntry, entry_id)
-        if not entry or entry.tournament_id != tournament_id:
-            raise HTTPException(404, "Standby entry not found")
-        is_standby = (
-            entry.original_list_type == "standby"
-            or (entry.original_list_type is None and entry.list_type == "standby")
+    result = await session.execute(
+        update(TournamentManualEntry)
+        .where(
+            TournamentManualEntry.id == entry_id,
+            TournamentManualEntry.tournament_id == tournament_id,
+            TournamentManualEntry.effective_original_list_type == "standby",
         )
-        if not is_standby:
-            raise HTTPException(404, "Standby entry not found")
-        entry.display_name = body.display_name.strip() or entry.display_name
-        await session.commit()
-        await session.refresh(entry)
-        return ManualEntryResponse.model_validate(entry)
+        .values(display_name=body.display_name.strip() or TournamentManualEntry.display_name)
+        .returning(TournamentManualEntry)
+    )
+    entry = result.scalar_one_or_none()
+    if not entry:
+        raise HTTPException(404, "Standby entry not found")
+    await session.commit()
+    return ManualEntryResponse.model_validate(entry)
 
 
 @router.delete("/tournaments/{tournament_id}/standby/{entry_id}")
-async def remove_standby(tournament_id: int, entry_id: int, user: User = Depends(require_moderator_user)):
+async def remove_standby(
+    tournament_id: int, entry_id: int,
+    user: User = Depends(require_moderator_user),
+    session: AsyncSession = Depends(get_async_session),
+):
     """Remove a standby entry."""
-    async with async_session_factory() as session:
-        entry = await session.get(TournamentManualEntry, entry_id)
-        if not entry or entry.tournament_id != tournament_id or entry.list_type != "standby":
-            raise HTTPException(404, "Standby entry not found")
-        await session.delete(entry)
-        await session.commit()
-        return {"ok": True}
+    await _delete_manual_entry(session, tournament_id, entry_id, "standby", "Standby entry not found")
+    await session.commit()
+    return {"ok": True}
 
 
 @router.patch("/tournaments/{tournament_id}/manual-entries/{entry_id}/move")
 async def move_manual_entry(
-    tournament_id: int, entry_id: int, body: ManualEntryMove, user: User = Depends(require_moderator_user)
+    tournament_id: int, entry_id: int, body: ManualEntryMove, user: User = Depends(require_moderator_user),
+    session: AsyncSession = Depends(get_async_session),
 ):
-    """Move a manual entry between participants and standby."""
+    """Move a manual entry between participants and standby (appended to the end of the target list)."""
     if body.list_type not in ("participant", "standby"):
         raise HTTPException(400, "list_type must be 'participant' or 'standby'")
-    async with async_session_factory() as session:
-        entry = await session.get(TournamentManualEntry, entry_id)
-        if not entry or entry.tournament_id != tournament_id:
-            raise HTTPException(404, "Entry not found")
-        if entry.list_type == body.list_type:
-            await session.refresh(entry)
-            return ManualEntryResponse.model_validate(entry)
-        result = await session.execute(
-            select(TournamentManualEntry)
-            .where(
+    result = await session.execute(
+        update(TournamentManualEntry)
+        .where(
+            TournamentManualEntry.id == entry_id,
+            TournamentManualEntry.tournament_id == tournament_id,
+            TournamentManualEntry.list_type != body.list_type,
+        )
+        .values(
+            list_type=body.list_type,
+            original_list_type=body.list_type,
+            sort_order=_next_sort_order(tournament_id, body.list_type),
+        )
+        .returning(TournamentManualEntry)
+    )
+    entry = result.scalar_one_or_none()
+    if entry is None:
+        # Missing, in another tournament, or already in the target list
+        entry = await session.scalar(
+            select(TournamentManualEntry).where(
+                TournamentManualEntry.id == entry_id,
                 TournamentManualEntry.tournament_id == tournament_id,
-                TournamentManualEntry.list_type == body.list_type,
             )
         )
-        max_order = max((e.sort_order for e in result.scalars().all()), default=-1)
-        entry.list_type = body.list_type
-        entry.original_list_type = body.list_type
-        entry.sort_order = max_order + 1
-        if body.list_type == "standby":
-            await session.execute(delete(TeamManualMember).where(TeamManualMember.manual_entry_id == entry_id))
-        await session.commit()
-        await session.refresh(entry)
+        if not entry:
+            raise HTTPException(404, "Entry not found")
         return ManualEntryResponse.model_validate(entry)
+    if body.list_type == "standby":
+        await session.execute(delete(TeamManualMember).where(TeamManualMember.manual_entry_id == entry_id))
+    await session.commit()
+    return ManualEntryResponse.model_validate(entry)
 
 
 @router.patch("/tournaments/{tournament_id}/standby/reorder")
-async def reorder_standby(tournament_id: int, body: ManualEntryReorder, user: User = Depends(require_moderator_user)):
+async def reorder_standby(
+    tournament_id: int, body: ManualEntryReorder,
+    user: User = Depends(require_moderator_user),
+    session: AsyncSession = Depends(get_async_session),
+):
     """Reorder standby entries."""
-    async with async_session_factory() as session:
-        for i, eid in enumerate(body.entry_ids):
-            entry = await session.get(TournamentManualEntry, eid)
-            if entry and entry.tournament_id == tournament_id and entry.list_type == "standby":
-                entry.sort_order = i
-        await session.commit()
-        return {"ok": True}
+    await _reorder_manual_entries(session, tournament_id, "standby", body.entry_ids)
+    await session.commit()
+    return {"ok": True}
 
 
 # --- Teams (for 2v2, 3v3, 4v4) ---
 
 
 @router.put("/tournaments/{tournament_id}/teams")
-async def update_teams(tournament_id: int, body: TeamsBulkUpdate, user: User = Depends(require_moderator_user)):
+async def update_teams(
+    tournament_id: int, body: TeamsBulkUpdate,
+    user: User = Depends(require_moderator_user),
+    session: AsyncSession = Depends(get_async_session),
+):
     """Replace all teams with the given structure. Removes existing bracket. Use for drag-drop editing."""
-    async with async_session_factory() as session:
-        t = await session.get(Tournament, tournament_id)
-        if not t or t.format == "1v1":
-            raise HTTPException(404, "Tournament not found or not a team format")
-        players_per_team = parse_format_players(t.format)
-        for team_data in body.teams:
-            if len(team_data.member_ids) > players_per_team:
-                raise HTTPException(400, f"Team '{team_data.name}' has too many members for {t.format}")
-        await session.execute(update(Registration).where(Registration.tournament_id == tournament_id).values(team_id=None))
-        existing_teams = await session.execute(select(Team).where(Team.tournament_id == tournament_id))
-        for team in existing_teams.scalars().all():
-            await session.delete(team)
-        existing_bracket = await session.execute(select(Bracket).where(Bracket.tournament_id == tournament_id))
-        bracket = existing_bracket.scalar_one_or_none()
-        if bracket:
-            await session.delete(bracket)
-        await session.flush()
-        created = []
-        for team_data in body.teams:
-            team = Team(tournament_id=tournament_id, name=team_data.name or "Unnamed")
-            session.add(team)
-            await session.flush()
-            for i, member_ref in enumerate(team_data.member_ids):
-                if member_ref is None:
+    fmt = await _get_tournament_format(session, tournament_id)
+    if fmt is None or fmt == "1v1":
+        raise HTTPException(404, "Tournament not found or not a team format")
+    players_per_team = parse_format_players(fmt)
+    for team_data in body.teams:
+        if len(team_data.member_ids) > players_per_team:
+            raise HTTPException(400, f"Team '{team_data.name}' has too many members for {fmt}")
+    await _tear_down_teams_and_bracket(session, tournament_id)
+    await session.flush()
+    manual_ids = {
+        ref if isinstance(ref, int) else int(ref)
+        for team_data in body.teams
+        for ref in team_data.member_ids
+        if ref is not None and not (isinstance(ref, str) and ref.startswith("discord:"))
+    }
+    valid_manual_ids: set[int] = set()
+    if manual_ids:
+        valid_result = await session.execute(
+            select(TournamentManualEntry.id).where(
+                TournamentManualEntry.tournament_id == tournament_id,
+                TournamentManualEntry.id.in_(manual_ids),
+            )
+        )
+        valid_manual_ids = set(valid_result.scalars().all())
+    names = [team_data.name or "Unnamed" for team_data in body.teams]
+    team_ids = []
+    if names:
+        team_ids = (
+            await session.scalars(
+                insert(Team).returning(Team.id, sort_by_parameter_order=True),
+                [{"tournament_id": tournament_id, "name": name} for name in names],
+            )
+        ).all()
+    manual_rows = []
+    reg_team: dict[int, int] = {}
+    for team_id, team_data in zip(team_ids, body.teams):
+        for i, member_ref in enumerate(team_data.member_ids):
+            if member_ref is None:
+                continue
+            if isinstance(member_ref, str) and member_ref.startswith("discord:"):
+                try:
+                    reg_team[int(member_ref.replace("discord:", ""))] = team_id
+                except ValueError:
                     continue
-                if isinstance(member_ref, str) and member_ref.startswith("discord:"):
-                    try:
-                        player_id = int(member_ref.replace("discord:", ""))
-                    except ValueError:
-                        continue
-                    reg_result = await session.execute(
-                        select(Registration).where(
-                            Registration.tournament_id == tournament_id,
-                            Registration.player_id == player_id,
-                        )
-                    )
-                    reg = reg_result.scalar_one_or_none()
-                    if reg:
-                        reg.team_id = team.id
-                else:
-                    eid = int(member_ref) if not isinstance(member_ref, int) else member_ref
-                    entry = await session.get(TournamentManualEntry, eid)
-                    if entry and entry.tournament_id == tournament_id:
-                        session.add(TeamManualMember(team_id=team.id, manual_entry_id=eid, sort_order=i))
-            created.append({"id": team.id, "name": team.name})
-        await session.commit()
-        return {"ok": True, "teams": created}
+            else:
+                eid = int(member_ref) if not isinstance(member_ref, int) else member_ref
+                if eid in valid_manual_ids:
+                    manual_rows.append({"team_id": team_id, "manual_entry_id": eid, "sort_order": i})
+    if manual_rows:
+        await session.execute(insert(TeamManualMember), manual_rows)
+    if reg_team:
+        await session.execute(
+            update(Registration)
+            .where(Registration.tournament_id == tournament_id, Registration.player_id.in_(reg_team))
+            .values(team_id=case(reg_team, value=Registration.player_id))
+            .execution_options(synchronize_session=False)
+        )
+    await session.commit()
+    created = [{"id": team_id, "name": name} for team_id, name in zip(team_ids, names)]
+    return {"ok": True, "teams": created}
+
+
+def _team_member_rows_select():
+    """Teams of a tournament with their members in one query: manual members (by sort_order), then Discord."""
+    manual_q = (
+        select(
+            TeamManualMember.team_id,
+            literal(0).label("grp"),
+            TournamentManualEntry.id.label("member_id"),
+            TournamentManualEntry.display_name,
+            TournamentManualEntry.original_list_type,
+            TeamManualMember.sort_order,
+        )
+        .join(TournamentManualEntry, TournamentManualEntry.id == TeamManualMember.manual_entry_id)
+        .where(TournamentManualEntry.tournament_id == bindparam("tid"))
+    )
+    discord_q = (
+        select(
+            Registration.team_id,
+            literal(1).label("grp"),
+            Registration.player_id,
+            Player.display_name,
+            null(),
+            Registration.id,
+        )
+        .outerjoin(Player, Player.discord_id == Registration.player_id)
+        .where(Registration.tournament_id == bindparam("tid"), Registration.team_id.is_not(None))
+    )
+    members = union_all(manual_q, discord_q).subquery()
+    return (
+        select(
+            Team.id,
+            Team.name,
+            members.c.grp,
+            members.c.member_id,
+            members.c.display_name,
+            members.c.original_list_type,
+        )
+        .outerjoin(members, members.c.team_id == Team.id)
+        .where(Team.tournament_id == bindparam("tid"))
+        .order_by(Team.id, members.c.grp, members.c.sort_order, members.c.member_id)
+    )
+
+
+_TEAM_MEMBER_ROWS_STMT = lambda_stmt(_team_member_rows_select)
 
 
 @router.get("/tournaments/{tournament_id}/teams")
-async def list_teams(tournament_id: int):
-    """List teams with their members (for team-format tournaments)."""
-    async with async_session_factory() as session:
-        t = await session.get(Tournament, tournament_id)
-        if not t:
-            raise HTTPException(404, "Tournament not found")
-        if t.format == "1v1":
-            return []
-        # Refresh Discord display names before loading (bot fetches from Discord API)
+async def list_teams(
+    tournament_id: int,
+    request: Request,
+    background_tasks: BackgroundTasks,
+    refresh: bool = False,
+    session: AsyncSession = Depends(get_async_session),
+):
+    """List teams with their members (for team-format tournaments). Discord names refresh after the response unless ?refresh=1."""
+    fmt = await _get_tournament_format(session, tournament_id)
+    if fmt is None:
+        raise HTTPException(404, "Tournament not found")
+    if fmt == "1v1":
+        return []
+    # Refresh Discord display names (bot fetches from Discord API). By default this runs after the
+    # response, so the player ids come from the team rows instead of a separate query.
+    if refresh:
         regs_pre = await session.execute(
             select(Registration.player_id).where(Registration.tournament_id == tournament_id)
         )
-        player_ids = list({r[0] for r in regs_pre.fetchall()})
-        await _refresh_player_names_from_discord(player_ids)
-        result = await session.execute(
-            select(Team)
-            .where(Team.tournament_id == tournament_id)
-            .options(
-                selectinload(Team.manual_members).selectinload(TeamManualMember.manual_entry),
-                selectinload(Team.members).selectinload(Registration.player),
+        await _refresh_player_names_from_discord(list({r[0] for r in regs_pre.fetchall()}))
+    rows = await session.execute(_TEAM_MEMBER_ROWS_STMT, {"tid": tournament_id})
+    teams: dict[int, dict] = {}
+    player_ids: list[int] = []
+    for team_id, name, grp, member_id, display_name, original_list_type in rows:
+        team = teams.get(team_id)
+        if team is None:
+            team = teams[team_id] = {"id": team_id, "name": name, "members": []}
+        if grp == 0:
+            team["members"].append(
+                {"id": member_id, "display_name": display_name, "original_list_type": original_list_type}
             )
-        )
-        teams = result.scalars().all()
-        members_by_team: dict[int, list[dict]] = {}
-        for team in teams:
-            manual = [
-                {
-                    "id": m.manual_entry.id,
-                    "display_name": m.manual_entry.display_name,
-                    "original_list_type": m.manual_entry.original_list_type,
-                }
-                for m in sorted(team.manual_members, key=lambda x: x.sort_order)
-            ]
-            discord = [
-                {"id": f"discord:{r.player_id}", "display_name": player_display_name(r.player, r.player_id)}
-                for r in team.members
-            ]
-            members_by_team[team.id] = manual + discord
-        return [
-            {"id": team.id, "name": team.name, "members": members_by_team.get(team.id, [])}
-            for team in teams
-        ]
+        elif grp == 1:
+            player_ids.append(member_id)
+            team["members"].append(
+                {"id": f"discord:{member_id}", "display_name": display_name_or_default(display_name)}
+            )
+    if not refresh:
+        background_tasks.add_task(_refresh_player_names_from_discord, player_ids)
+    return json_response(list(teams.values()), request=request)
 
 
 @router.post("/tournaments/{tournament_id}/teams/substitute")
-async def substitute_standby(tournament_id: int, body: SubstituteRequest):
+async def substitute_standby(tournament_id: int, body: SubstituteRequest, session: AsyncSession = Depends(get_async_session)):
     """Replace a team member (who left) with a standby player."""
-    async with async_session_factory() as session:
-        t = await session.get(Tournament, tournament_id)
-        if not t or t.format == "1v1":
-            raise HTTPException(404, "Tournament not found or not a team format")
-        team = await session.get(Team, body.team_id)
-        if not team or team.tournament_id != tournament_id:
-            raise HTTPException(404, "Team not found")
-        member_entry = await session.get(TournamentManualEntry, body.member_entry_id)
-        standby_entry = await session.get(TournamentManualEntry, body.standby_entry_id)
-        if not member_entry or member_entry.tournament_id != tournament_id:
-            raise HTTPException(404, "Member not found")
-        if not standby_entry or standby_entry.tournament_id != tournament_id or standby_entry.list_type != "standby":
-            raise HTTPException(404, "Standby entry not found")
-        tmm = await session.execute(
-            select(TeamManualMember).where(
-                TeamManualMember.team_id == body.team_id,
-                TeamManualMember.manual_entry_id == body.member_entry_id,
-            )
+    fmt = await _get_tournament_format(session, tournament_id)
+    if fmt is None or fmt == "1v1":
+        raise HTTPException(404, "Tournament not found or not a team format")
+    # Team and the leaving member's slot in one query; both entries in another
+    team_result = await session.execute(
+        select(Team.id, TeamManualMember)
+        .outerjoin(
+            TeamManualMember,
+            (TeamManualMember.team_id == Team.id) & (TeamManualMember.manual_entry_id == body.member_entry_id),
         )
-        tmm = tmm.scalar_one_or_none()
-        if not tmm:
-            raise HTTPException(404, "Member not in this team")
-        tmm.manual_entry_id = body.standby_entry_id
-        standby_entry.list_type = "participant"
-        await session.commit()
-        return {"ok": True}
+        .where(Team.id == body.team_id, Team.tournament_id == tournament_id)
+    )
+    team_row = team_result.first()
+    if not team_row:
+        raise HTTPException(404, "Team not found")
+    entries_result = await session.execute(
+        select(TournamentManualEntry).where(
+            TournamentManualEntry.id.in_([body.member_entry_id, body.standby_entry_id]),
+            TournamentManualEntry.tournament_id == tournament_id,
+        )
+    )
+    entries = {e.id: e for e in entries_result.scalars().all()}
+    member_entry = entries.get(body.member_entry_id)
+    standby_entry = entries.get(body.standby_entry_id)
+    if not member_entry:
+        raise HTTPException(404, "Member not found")
+    if not standby_entry or standby_entry.list_type != "standby":
+        raise HTTPException(404, "Standby entry not found")
+    tmm = team_row.TeamManualMember
+    if not tmm:
+        raise HTTPException(404, "Member not in this team")
+    tmm.manual_entry_id = body.standby_entry_id
+    standby_entry.list_type = "participant"
+    await session.commit()
+    return {"ok": True}
 
 
 @router.post("/tournaments/{tournament_id}/teams/regenerate")
-async def regenerate_teams(tournament_id: int, user: User = Depends(require_moderator_user)):
+async def regenerate_teams(
+    tournament_id: int,
+    user: User = Depends(require_moderator_user),
+    session: AsyncSession = Depends(get_async_session),
+):
     """Regenerate teams from participants + standby (manual and Discord). Deletes existing bracket; generate bracket separately when ready."""
-    async with async_session_factory() as session:
-        t = await session.get(Tournament, tournament_id)
-        if not t or t.format == "1v1":
-            raise HTTPException(404, "Tournament not found or not a team format")
-        players_per_team = parse_format_players(t.format)
-
-        # Build pool: participants first, then Discord, then standby (standby used last)
-        participants_result = await session.execute(
-            select(TournamentManualEntry)
-            .where(
-                TournamentManualEntry.tournament_id == tournament_id,
-                TournamentManualEntry.list_type == "participant",
-            )
-            .order_by(TournamentManualEntry.sort_order, TournamentManualEntry.id)
+    fmt = await _get_tournament_format(session, tournament_id)
+    if fmt is None or fmt == "1v1":
+        raise HTTPException(404, "Tournament not found or not a team format")
+    players_per_team = parse_format_players(fmt)
+
+    # Build pool of ids: participants first, then Discord, then standby (standby used last)
+    participants_result = await session.execute(
+        select(TournamentManualEntry.id)
+        .where(
+            TournamentManualEntry.tournament_id == tournament_id,
+            TournamentManualEntry.list_type == "participant",
         )
-        manual_participants = list(participants_result.scalars().all())
+        .order_by(TournamentManualEntry.sort_order, TournamentManualEntry.id)
+    )
+    manual_participants = list(participants_result.scalars().all())
 
-        regs_result = await session.execute(
-            select(Registration)
-            .where(Registration.tournament_id == tournament_id)
-            .options(selectinload(Registration.player))
-        )
-        discord_regs = list(regs_result.scalars().all())
+    regs_result = await session.execute(
+        select(Registration.player_id).where(Registration.tournament_id == tournament_id)
+    )
+    discord_regs = list(regs_result.scalars().all())
 
-        standby_result = await session.execute(
-            select(TournamentManualEntry)
-            .where(
-                TournamentManualEntry.tournament_id == tournament_id,
-                TournamentManualEntry.list_type == "standby",
-            )
-            .order_by(TournamentManualEntry.sort_order, TournamentManualEntry.id)
+    standby_result = await session.execute(
+        select(TournamentManualEntry.id)
+        .where(
+            TournamentManualEntry.tournament_id == tournament_id,
+            TournamentManualEntry.list_type == "standby",
         )
-        manual_standby = list(standby_result.scalars().all())
-        # Do NOT change list_type to "participant" - that would create duplicates (standby
-        # would appear in both participants and standby lists, breaking subsequent regenerations)
-
-        # Pool: participants + Discord shuffled together; standby used last (shuffled separately).
-        participants_and_discord: list[tuple[object, str]] = [(e, "manual") for e in manual_participants]
-        participants_and_discord += [(r, "discord") for r in discord_regs]
-        random.shuffle(participants_and_discord)
-        random.shuffle(manual_standby)
-        pool: list[tuple[object, str]] = participants_and_discord + [(e, "manual") for e in manual_standby]
-
-        if len(pool) < players_per_team:
-            raise HTTPException(400, f"Need at least {players_per_team} players to form teams")
-
-        # Clear team assignments before deleting teams (keeps Discord users in participants list)
-        await session.execute(update(Registration).where(Registration.tournament_id == tournament_id).values(team_id=None))
-        await session.flush()  # Ensure update is applied before delete (avoids FK/cascade issues)
-        existing_teams = await session.execute(select(Team).where(Team.tournament_id == tournament_id))
-        for team in existing_teams.scalars().all():
-            await session.delete(team)
-        existing_bracket = await session.execute(select(Bracket).where(Bracket.tournament_id == tournament_id))
-        bracket = existing_bracket.scalar_one_or_none()
-        if bracket:
-            await session.delete(bracket)
-        await session.flush()
-
-        team_num = 0
-        for i in range(0, len(pool), players_per_team):
-            chunk = pool[i : i + players_per_team]
-            if len(chunk) < players_per_team:
-                break
-            team = Team(tournament_id=tournament_id, name=f"Team {team_num + 1}")
-            session.add(team)
-            await session.flush()
-            for j, (item, kind) in enumerate(chunk):
-                if kind == "manual":
-                    session.add(TeamManualMember(team_id=team.id, manual_entry_id=item.id, sort_order=j))
-                else:
-                    # Re-query Registration after teams were deleted (like update_teams)
-                    reg_result = await session.execute(
-                        select(Registration).where(
-                            Registration.tournament_id == tournament_id,
-                            Registration.player_id == item.player_id,
-                        )
-                    )
-                    reg = reg_result.scalar_one_or_none()
-                    if reg:
-                        reg.team_id = team.id
-            team_num += 1
-        await session.commit()
-        return {"ok": True, "teams_created": team_num}
+        .order_by(TournamentManualEntry.sort_order, TournamentManualEntry.id)
+    )
+    manual_standby = list(standby_result.scalars().all())
+    # Do NOT change list_type to "participant" - that would create duplicates (standby
+    # would appear in both participants and standby lists, breaking subsequent regenerations)
+
+    # Pool: participants + Discord shuffled together; standby used last (shuffled separately).
+    participants_and_discord: list[tuple[int, str]] = [(eid, "manual") for eid in manual_participants]
+    participants_and_discord += [(pid, "discord") for pid in discord_regs]
+    random.shuffle(participants_and_discord)
+    random.shuffle(manual_standby)
+    pool: list[tuple[int, str]] = participants_and_discord + [(eid, "manual") for eid in manual_standby]
+
+    if len(pool) < players_per_team:
+        raise HTTPException(400, f"Need at least {players_per_team} players to form teams")
+
+    await _tear_down_teams_and_bracket(session, tournament_id)
+    await session.flush()
+
+    chunks = [
+        pool[i : i + players_per_team]
+        for i in range(0, len(pool) - players_per_team + 1, players_per_team)
+    ]
+    team_num = len(chunks)
+    team_ids = (
+        await session.scalars(
+            insert(Team).returning(Team.id, sort_by_parameter_order=True),
+            [{"tournament_id": tournament_id, "name": f"Team {n + 1}"} for n in range(team_num)],
+        )
+    ).all()
+    manual_rows = []
+    reg_team: dict[int, int] = {}
+    for team_id, chunk in zip(team_ids, chunks):
+        for j, (item_id, kind) in enumerate(chunk):
+            if kind == "manual":
+                manual_rows.append({"team_id": team_id, "manual_entry_id": item_id, "sort_order": j})
+            else:
+                reg_team[item_id] = team_id
+    if manual_rows:
+        await session.execute(insert(TeamManualMember), manual_rows)
+    if reg_team:
+        await session.execute(
+            update(Registration)
+            .where(Registration.tournament_id == tournament_id, Registration.player_id.in_(reg_team))
+            .values(team_id=case(reg_team, value=Registration.player_id))
+            .execution_options(synchronize_session=False)
+        )
+    await session.commit()
+    return {"ok": True, "teams_created": team_num}
 
 
 # --- Tournaments ---
@@ -727,12 +972,11 @@ class TournamentCreate(BaseModel):
     registration_deadline: Optional[str] = None  # ISO datetime, e.g. 2026-02-24T18:00:00
 
 
+_MMR_MAP = {"1v1": "solo_duel", "2v2": "doubles"}
+
+
 def _mmr_for_format(fmt: str) -> str:
-    if fmt == "1v1":
-        return "solo_duel"
-    if fmt == "2v2":
-        return "doubles"
-    return "standard"
+    return _MMR_MAP.get(fmt, "standard")
 
 
 def _parse_deadline(s: Optional[str]):
@@ -750,11 +994,12 @@ def _parse_deadline(s: Optional[str]):
 
 
 @router.post("/tournaments")
-async def create_tournament(body: TournamentCreate):
+async def create_tournament(body: TournamentCreate, session: AsyncSession = Depends(get_async_session)):
     """Create a tournament (for web UI; guild_id=0 for non-Discord use)."""
     reg_deadline = _parse_deadline(body.registration_deadline)
-    async with async_session_factory() as session:
-        t = Tournament(
+    result = await session.execute(
+        insert(Tournament)
+        .values(
             guild_id=body.guild_id or 0,
             name=body.name,
             format=body.format,
@@ -762,235 +1007,291 @@ async def create_tournament(body: TournamentCreate):
             status="open",
             registration_deadline=reg_deadline,
         )
-        session.add(t)
-        await session.commit()
-        await session.refresh(t)
-        return {"id": t.id, "name": t.name, "format": t.format, "registration_deadline": t.registration_deadline.isoformat() if t.registration_deadline else None}
+        .returning(Tournament.id, Tournament.name, Tournament.format, Tournament.registration_deadline)
+    )
+    t = result.one()
+    await session.commit()
+    _invalidate_tournament_cache()
+    return {"id": t.id, "name": t.name, "format": t.format, "registration_deadline": t.registration_deadline.isoformat() if t.registration_deadline else None}
+
+
+async def _finished_tournaments_with_bracket(session: AsyncSession) -> list[tuple[Row, int]]:
+    """Latest 100 completed/closed/archived tournaments paired with their newest bracket id, in one query.
+
+    Tournaments come back as (id, name, format, created_at) rows. Tournaments without a bracket count
+    toward the 100 but are left out of the result.
+    """
+    latest = select(
+        Bracket.id,
+        Bracket.tournament_id,
+        func.row_number()
+        .over(partition_by=Bracket.tournament_id, order_by=Bracket.id.desc())
+        .label("rn"),
+    ).subquery()
+    result = await session.execute(
+        select(Tournament.id, Tournament.name, Tournament.format, Tournament.created_at, latest.c.id.label("bracket_id"))
+        .outerjoin(latest, and_(latest.c.tournament_id == Tournament.id, latest.c.rn == 1))
+        .where(
+            or_(
+                Tournament.status == "completed",
+                Tournament.status == "closed",
+                Tournament.archived == True,  # noqa: E712
+            )
+        )
+        .order_by(Tournament.id.desc())
+        .limit(100)
+    )
+    return [(row, row.bracket_id) for row in result if row.bracket_id is not None]
+
+
+async def _champion_matches(session: AsyncSession, bracket_ids: list[int]) -> dict[int, BracketMatch]:
+    """Champion match per bracket id: the decided grand_finals match (double elim), else the decided match in
+    the highest round (single elim). The pick runs in SQL so only one row per bracket comes back."""
+    if not bracket_ids:
+        return {}
+    ranked = (
+        select(
+            BracketMatch.id,
+            func.row_number()
+            .over(
+                partition_by=BracketMatch.bracket_id,
+                order_by=(
+                    case((BracketMatch.bracket_section == "grand_finals", 0), else_=1),
+                    BracketMatch.round_num.desc(),
+                    BracketMatch.match_num.desc(),
+                ),
+            )
+            .label("rn"),
+        )
+        .where(BracketMatch.bracket_id.in_(bracket_ids), MATCH_HAS_WINNER)
+        .subquery()
+    )
+    result = await session.execute(
+        select(BracketMatch)
+        .join(ranked, and_(ranked.c.id == BracketMatch.id, ranked.c.rn == 1))
+        .options(raiseload("*"))
+    )
+    return {m.bracket_id: m for m in result.scalars()}
+
+
+def _finalist_of(m: BracketMatch) -> tuple[int | None, int | None, int | None]:
+    """(team_id, player_id, manual_entry_id) of the loser of a decided final match."""
+    if m.winner_team_id:
+        return (m.team2_id if m.winner_team_id == m.team1_id else m.team1_id), None, None
+    if m.winner_player_id:
+        player_id = m.player2_id if m.winner_player_id == m.player1_id else m.player1_id
+        if player_id:
+            return None, player_id, None
+        return None, None, (m.manual_entry2_id if m.winner_player_id == m.player1_id else m.manual_entry1_id)
+    return None, None, (m.manual_entry1_id if m.winner_manual_entry_id == m.manual_entry2_id else m.manual_entry2_id)
 
 
 @router.get("/winners")
-async def list_winners():
+async def list_winners(session: AsyncSession = Depends(get_async_session)):
     """List all-time tournament champions (completed, closed, or archived tournaments with a bracket winner)."""
-    async with async_session_factory() as session:
+    finished = await _finished_tournaments_with_bracket(session)
+    champs = await _champion_matches(session, [bracket_id for _, bracket_id in finished])
+    finals = []
+    team_ids: set[int] = set()
+    player_ids: set[int] = set()
+    entry_ids: set[int] = set()
+    for t, bracket_id in finished:
+        m = champs.get(bracket_id)
+        if m is None:
+            continue
+        finalist = _finalist_of(m)
+        finals.append((t, m, finalist))
+        for ids, winner_id, finalist_id in (
+            (team_ids, m.winner_team_id, finalist[0]),
+            (player_ids, m.winner_player_id, finalist[1]),
+            (entry_ids, m.winner_manual_entry_id, finalist[2]),
+        ):
+            if winner_id:
+                ids.add(winner_id)
+            if finalist_id:
+                ids.add(finalist_id)
+
+    # One query per entity type for every winner and finalist
+    teams: dict[int, Team] = {}
+    players: dict[int, Player] = {}
+    entries: dict[int, TournamentManualEntry] = {}
+    if team_ids:
         result = await session.execute(
-            select(Tournament)
-            .where(
-                or_(
-                    Tournament.status == "completed",
-                    Tournament.status == "closed",
-                    Tournament.archived == True,  # noqa: E712
-                )
+            select(Team)
+            .where(Team.id.in_(team_ids))
+            .options(
+                selectinload(Team.members).options(selectinload(Registration.player), raiseload("*")),
+                selectinload(Team.manual_members).options(
+                    selectinload(TeamManualMember.manual_entry), raiseload("*")
+                ),
+                raiseload("*"),
             )
-            .order_by(Tournament.id.desc())
-            .limit(100)
         )
-        tournaments = result.scalars().all()
-        winners = []
-        for t in tournaments:
-            bracket_result = await session.execute(
-                select(Bracket)
-                .where(Bracket.tournament_id == t.id)
-                .order_by(Bracket.id.desc())
-                .limit(1)
-            )
-            bracket = bracket_result.scalar_one_or_none()
-            if not bracket:
-                continue
-            # Find champion: grand_finals match (double elim) or highest round (single elim)
-            matches_result = await session.execute(
-                select(BracketMatch)
-                .where(BracketMatch.bracket_id == bracket.id)
-                .where(
-                    or_(
-                        BracketMatch.winner_team_id != None,  # noqa: E711
-                        BracketMatch.winner_player_id != None,  # noqa: E711
-                        BracketMatch.winner_manual_entry_id != None,  # noqa: E711
-                    )
-                )
-            )
-            champ_matches = matches_result.scalars().all()
-            champ_match = None
-            for m in champ_matches:
-                if m.bracket_section == "grand_finals":
-                    champ_match = m
-                    break
-            if not champ_match and champ_matches:
-                # Single elim: final has highest round_num (and typically highest match_num in that round)
-                champ_match = max(champ_matches, key=lambda x: (x.round_num, x.match_num))
-            if not champ_match:
-                continue
-            winner_name = None
-            winner_players = None  # List of player names for team formats
-            winner_player_id = None
-            winner_team_id = None
-            winner_player_ids = None  # For team members (Discord IDs)
-            winner_manual_entry_id = None
-            winner_display_name = None  # For manual entry matching
-            if champ_match.winner_team_id:
-                winner_team_id = champ_match.winner_team_id
-                team_result = await session.execute(
-                    select(Team)
-                    .where(Team.id == champ_match.winner_team_id)
-                    .options(
-                        selectinload(Team.members).selectinload(Registration.player),
-                        selectinload(Team.manual_members).selectinload(TeamManualMember.manual_entry),
-                    )
-                )
-                team = team_result.scalar_one_or_none()
-                if team:
-                    winner_name = team.name
-                    player_names = []
-                    player_ids = []
-                    for reg in team.members:
-                        if reg.player:
-                            player_names.append(player_display_name(reg.player, reg.player_id))
-                            player_ids.append(reg.player_id)
-                    for tmm in sorted(team.manual_members, key=lambda x: x.sort_order):
-                        if tmm.manual_entry:
-                            player_names.append(tmm.manual_entry.display_name)
-                    if player_names:
-                        winner_players = player_names
-                    if player_ids:
-                        winner_player_ids = player_ids
-            elif champ_match.winner_player_id:
-                winner_player_id = champ_match.winner_player_id
-                player = await session.get(Player, champ_match.winner_player_id)
-                winner_name = player_display_name(player, champ_match.winner_player_id) if player else None
-            elif champ_match.winner_manual_entry_id:
-                winner_manual_entry_id = champ_match.winner_manual_entry_id
-                entry = await session.get(TournamentManualEntry, champ_match.winner_manual_entry_id)
-                winner_name = entry.display_name if entry else None
-                winner_display_name = winner_name
-            # Compute finalist (loser of the final match)
-            finalist_player_id = None
-            finalist_team_id = None
-            finalist_player_ids = None
-            finalist_manual_entry_id = None
-            finalist_display_name = None
-            finalist_name = None
-            if champ_match.winner_team_id:
-                # Winner is team1 or team2; finalist is the other team
-                finalist_team_id = champ_match.team2_id if champ_match.winner_team_id == champ_match.team1_id else champ_match.team1_id
-                if finalist_team_id:
-                    ft_result = await session.execute(
-                        select(Team)
-                        .where(Team.id == finalist_team_id)
-                        .options(
-                            selectinload(Team.members).selectinload(Registration.player),
-                        )
-                    )
-                    ft = ft_result.scalar_one_or_none()
-                    if ft:
-                        finalist_name = ft.name
-                        finalist_player_ids = [r.player_id for r in ft.members if r.player_id]
-            elif champ_match.winner_player_id:
-                # Finalist is the other player
-                finalist_player_id = champ_match.player2_id if champ_match.winner_player_id == champ_match.player1_id else champ_match.player1_id
-                if finalist_player_id:
-                    fp = await session.get(Player, finalist_player_id)
-                    finalist_name = player_display_name(fp, finalist_player_id) if fp else None
-                else:
-                    fe_id = champ_match.manual_entry2_id if champ_match.winner_player_id == champ_match.player1_id else champ_match.manual_entry1_id
-                    if fe_id:
-                        fe = await session.get(TournamentManualEntry, fe_id)
-                        finalist_manual_entry_id = fe_id
-                        finalist_display_name = fe.display_name if fe else None
-                        finalist_name = finalist_display_name
-            elif champ_match.winner_manual_entry_id:
-                fe_id = champ_match.manual_entry1_id if champ_match.winner_manual_entry_id == champ_match.manual_entry2_id else champ_match.manual_entry2_id
-                if fe_id:
-                    fe = await session.get(TournamentManualEntry, fe_id)
-                    finalist_manual_entry_id = fe_id
-                    finalist_display_name = fe.display_name if fe else None
-                    finalist_name = finalist_display_name
-            if winner_name:
-                row = {
-                    "tournament_id": t.id,
-                    "tournament_name": t.name,
-                    "format": t.format,
-                    "winner_name": winner_name,
-                    "created_at": t.created_at.isoformat() if t.created_at else None,
-                }
-                if winner_players is not None:
-                    row["winner_players"] = winner_players
-                if winner_player_id is not None:
-                    row["winner_player_id"] = winner_player_id
-                if winner_team_id is not None:
-                    row["winner_team_id"] = winner_team_id
-                if winner_player_ids is not None:
-                    row["winner_player_ids"] = winner_player_ids
-                if winner_manual_entry_id is not None:
-                    row["winner_manual_entry_id"] = winner_manual_entry_id
-                if winner_display_name is not None:
-                    row["winner_display_name"] = winner_display_name
-                if finalist_name is not None:
-                    row["finalist_name"] = finalist_name
-                if finalist_player_id is not None:
-                    row["finalist_player_id"] = finalist_player_id
-                if finalist_team_id is not None:
-                    row["finalist_team_id"] = finalist_team_id
-                if finalist_player_ids is not None:
-                    row["finalist_player_ids"] = finalist_player_ids
-                if finalist_manual_entry_id is not None:
-                    row["finalist_manual_entry_id"] = finalist_manual_entry_id
-                if finalist_display_name is not None:
-                    row["finalist_display_name"] = finalist_display_name
-                winners.append(row)
-        return winners
+        teams = {team.id: team for team in result.scalars()}
+    if player_ids:
+        result = await session.execute(select(Player).where(Player.discord_id.in_(player_ids)))
+        players = {p.discord_id: p for p in result.scalars()}
+    if entry_ids:
+        result = await session.execute(
+            select(TournamentManualEntry).where(TournamentManualEntry.id.in_(entry_ids))
+        )
+        entries = {e.id: e for e in result.scalars()}
+
+    winners = []
+    for t, champ_match, (finalist_team_id, finalist_player_id, finalist_manual_entry_id) in finals:
+        winner_name = None
+        winner_players = None  # List of player names for team formats
+        winner_player_id = None
+        winner_team_id = None
+        winner_player_ids = None  # For team members (Discord IDs)
+        winner_manual_entry_id = None
+        winner_display_name = None  # For manual entry matching
+        if champ_match.winner_team_id:
+            winner_team_id = champ_match.winner_team_id
+            team = teams.get(winner_team_id)
+            if team:
+                winner_name = team.name
+                player_names = []
+                member_ids = []
+                for reg in team.members:
+                    if reg.player:
+                        player_names.append(player_display_name(reg.player, reg.player_id))
+                        member_ids.append(reg.player_id)
+                for tmm in team.manual_members:
+                    if tmm.manual_entry:
+                        player_names.append(tmm.manual_entry.display_name)
+                if player_names:
+                    winner_players = player_names
+                if member_ids:
+                    winner_player_ids = member_ids
+        elif champ_match.winner_player_id:
+            winner_player_id = champ_match.winner_player_id
+            player = players.get(winner_player_id)
+            winner_name = player_display_name(player, winner_player_id) if player else None
+        elif champ_match.winner_manual_entry_id:
+            winner_manual_entry_id = champ_match.winner_manual_entry_id
+            entry = entries.get(winner_manual_entry_id)
+            winner_name = entry.display_name if entry else None
+            winner_display_name = winner_name
+        # Finalist (loser of the final match)
+        finalist_player_ids = None
+        finalist_display_name = None
+        finalist_name = None
+        if finalist_team_id:
+            ft = teams.get(finalist_team_id)
+            if ft:
+                finalist_name = ft.name
+                finalist_player_ids = [r.player_id for r in ft.members if r.player_id]
+        elif finalist_player_id:
+            fp = players.get(finalist_player_id)
+            finalist_name = player_display_name(fp, finalist_player_id) if fp else None
+        elif finalist_manual_entry_id:
+            fe = entries.get(finalist_manual_entry_id)
+            finalist_display_name = fe.display_name if fe else None
+            finalist_name = finalist_display_name
+        if winner_name:
+            row = {
+                "tournament_id": t.id,
+                "tournament_name": t.name,
+                "format": t.format,
+                "winner_name": winner_name,
+                "created_at": t.created_at.isoformat() if t.created_at else None,
+            }
+            if winner_players is not None:
+                row["winner_players"] = winner_players
+            if winner_player_id is not None:
+                row["winner_player_id"] = winner_player_id
+            if winner_team_id is not None:
+                row["winner_team_id"] = winner_team_id
+            if winner_player_ids is not None:
+                row["winner_player_ids"] = winner_player_ids
+            if winner_manual_entry_id is not None:
+                row["winner_manual_entry_id"] = winner_manual_entry_id
+            if winner_display_name is not None:
+                row["winner_display_name"] = winner_display_name
+            if finalist_name is not None:
+                row["finalist_name"] = finalist_name
+            if finalist_player_id is not None:
+                row["finalist_player_id"] = finalist_player_id
+            if finalist_team_id is not None:
+                row["finalist_team_id"] = finalist_team_id
+            if finalist_player_ids is not None:
+                row["finalist_player_ids"] = finalist_player_ids
+            if finalist_manual_entry_id is not None:
+                row["finalist_manual_entry_id"] = finalist_manual_entry_id
+            if finalist_display_name is not None:
+                row["finalist_display_name"] = finalist_display_name
+            winners.append(row)
+    return json_response(winners)
 
 
 @router.get("/tournaments/current")
-async def get_current_tournament(tournament_id: Optional[int] = None):
+async def get_current_tournament(tournament_id: Optional[int] = None, session: AsyncSession = Depends(get_async_session)):
     """Get open tournaments for /current page. Returns list of open/in_progress tournaments with default_id (latest).
     Optional tournament_id returns that specific tournament if it's open."""
-    async with async_session_factory() as session:
-        result = await session.execute(
-            select(Tournament)
-            .where(Tournament.archived == False)  # noqa: E712
-            .where(Tournament.status.in_(["open", "in_progress"]))
-            .order_by(Tournament.id.desc())
-            .limit(50)
-        )
-        tournaments = result.scalars().all()
-        if not tournaments:
-            return {"tournaments": [], "default_id": None}
-        default_id = tournaments[0].id
-        list_data = [
-            {
-                "id": t.id,
-                "name": t.name,
-                "format": t.format,
-                "status": t.status,
-                "archived": t.archived,
-                "registration_deadline": t.registration_deadline.isoformat() if t.registration_deadline else None,
-            }
-            for t in tournaments
-        ]
-        if tournament_id and any(t.id == tournament_id for t in tournaments):
-            return {"tournaments": list_data, "default_id": default_id, "selected_id": tournament_id}
-        return {"tournaments": list_data, "default_id": default_id}
+    result = await session.execute(
+        select(Tournament)
+        .where(Tournament.archived == False)  # noqa: E712
+        .where(Tournament.status.in_(["open", "in_progress"]))
+        .order_by(Tournament.id.desc())
+        .limit(50)
+    )
+    tournaments = result.scalars().all()
+    if not tournaments:
+        return {"tournaments": [], "default_id": None}
+    default_id = tournaments[0].id
+    list_data = [
+        {
+            "id": t.id,
+            "name": t.name,
+            "format": t.format,
+            "status": t.status,
+            "archived": t.archived,
+            "registration_deadline": t.registration_deadline.isoformat() if t.registration_deadline else None,
+        }
+        for t in tournaments
+    ]
+    if tournament_id and any(t.id == tournament_id for t in tournaments):
+        return {"tournaments": list_data, "default_id": default_id, "selected_id": tournament_id}
+    return {"tournaments": list_data, "default_id": default_id}
 
 
 @router.get("/tournaments")
-async def list_tournaments(include_archived: bool = False):
+async def list_tournaments(request: Request, include_archived: bool = False, session: AsyncSession = Depends(get_async_session)):
     """List tournaments. By default excludes archived. Use ?include_archived=1 to include them."""
-    async with async_session_factory() as session:
-        q = select(Tournament).order_by(Tournament.id.desc()).limit(50)
-        if not include_archived:
-            q = q.where(Tournament.archived == False)  # noqa: E712
-        result = await session.execute(q)
-        tournaments = result.scalars().all()
-        return [
-            {
-                "id": t.id,
-                "name": t.name,
-                "format": t.format,
-                "status": t.status,
-                "archived": t.archived,
-                "registration_deadline": t.registration_deadline.isoformat() if t.registration_deadline else None,
-            }
-            for t in tournaments
-        ]
+    now = time.monotonic()
+    hit = _tournament_list_cache.get(include_archived)
+    if hit and hit[0] > now:
+        return json_response(hit[1], request=request)
+    # Plain columns: no ORM hydration for a list that only needs scalars
+    q = (
+        select(
+            Tournament.id,
+            Tournament.name,
+            Tournament.format,
+            Tournament.status,
+            Tournament.archived,
+            Tournament.registration_deadline,
+        )
+        .order_by(Tournament.id.desc())
+        .limit(50)
+    )
+    if not include_archived:
+        q = q.where(Tournament.archived == False)  # noqa: E712
+    rows = await session.stream(q)
+    data = [
+        {
+            "id": t.id,
+            "name": t.name,
+            "format": t.format,
+            "status": t.status,
+            "archived": t.archived,
+            "registration_deadline": t.registration_deadline.isoformat() if t.registration_deadline else None,
+        }
+        async for t in rows
+    ]
+    _tournament_list_cache[include_archived] = (now + _CACHE_TTL, data)
+    return json_response(data, request=request)
 
 
 class TournamentUpdate(BaseModel):
@@ -1002,46 +1303,38 @@ class TournamentUpdate(BaseModel):
 
 
 @router.patch("/tournaments/{tournament_id}")
-async def update_tournament(tournament_id: int, body: TournamentUpdate, user: User = Depends(require_moderator_user)):
+async def update_tournament(
+    tournament_id: int, body: TournamentUpdate,
+    user: User = Depends(require_moderator_user),
+    session: AsyncSession = Depends(get_async_session),
+):
     """Rename or update a tournament. Format change clears teams/bracket when switching to 1v1."""
-    async with async_session_factory() as session:
-        t = await session.get(Tournament, tournament_id)
-        if not t:
-            raise HTTPException(404, "Tournament not found")
-        if body.name is not None:
-            t.name = body.name
-        if body.format is not None:
-            old_format = t.format
-            t.format = body.format
-            t.mmr_playlist = _mmr_for_format(body.format)
-            if old_format != body.format:
-                if body.format == "1v1":
-                    for team in (await session.execute(select(Team).where(Team.tournament_id == tournament_id))).scalars().all():
-                        await session.delete(team)
-                    bracket = (await session.execute(select(Bracket).where(Bracket.tournament_id == tournament_id))).scalar_one_or_none()
-                    if bracket:
-                        await session.delete(bracket)
-                elif old_format == "1v1":
-                    for team in (await session.execute(select(Team).where(Team.tournament_id == tournament_id))).scalars().all():
-                        await session.delete(team)
-                    bracket = (await session.execute(select(Bracket).where(Bracket.tournament_id == tournament_id))).scalar_one_or_none()
-                    if bracket:
-                        await session.delete(bracket)
-        if body.status is not None:
-            t.status = body.status
-        if body.archived is not None:
-            t.archived = body.archived
-        if body.registration_deadline is not None:
-            t.registration_deadline = _parse_deadline(body.registration_deadline)
-        await session.commit()
-        await session.refresh(t)
-        return {
-            "id": t.id,
-            "name": t.name,
-            "format": t.format,
-            "status": t.status,
-            "registration_deadline": t.registration_deadline.isoformat() if t.registration_deadline else None,
-        }
+    t = await session.get(Tournament, tournament_id)
+    if not t:
+        raise HTTPException(404, "Tournament not found")
+    if body.name is not None:
+        t.name = body.name
+    if body.format is not None:
+        old_format = t.format
+        t.format = body.format
+        t.mmr_playlist = _mmr_for_format(body.format)
+        if old_format != body.format and "1v1" in (body.format, old_format):
+            await _tear_down_teams_and_bracket(session, tournament_id)
+    if body.status is not None:
+        t.status = body.status
+    if body.archived is not None:
+        t.archived = body.archived
+    if body.registration_deadline is not None:
+        t.registration_deadline = _parse_deadline(body.registration_deadline)
+    await session.commit()
+    _invalidate_tournament_cache()
+    return {
+        "id": t.id,
+        "name": t.name,
+        "format": t.format,
+        "status": t.status,
+        "registration_deadline": t.registration_deadline.isoformat() if t.registration_deadline else None,
+    }
 
 
 class CloneTournamentRequest(BaseModel):
@@ -1054,16 +1347,18 @@ async def clone_tournament(
     tournament_id: int,
     body: Optional[CloneTournamentRequest] = None,
     user: User = Depends(require_moderator_user),
+    session: AsyncSession = Depends(get_async_session),
 ):
     """Clone a tournament with its participants and standby. Optionally set new name/format."""
-    async with async_session_factory() as session:
-        src = await session.get(Tournament, tournament_id)
-        if not src:
-            raise HTTPException(404, "Tournament not found")
-        req = body.model_dump() if body else {}
-        name = req.get("name") or f"{src.name} (copy)"
-        fmt = req.get("format") or src.format
-        t = Tournament(
+    src = await session.get(Tournament, tournament_id)
+    if not src:
+        raise HTTPException(404, "Tournament not found")
+    req = body.model_dump() if body else {}
+    name = req.get("name") or f"{src.name} (copy)"
+    fmt = req.get("format") or src.format
+    result = await session.execute(
+        insert(Tournament)
+        .values(
             guild_id=src.guild_id,
             name=name,
             format=fmt,
@@ -1071,27 +1366,28 @@ async def clone_tournament(
             status="open",
             archived=False,
         )
-        session.add(t)
-        await session.flush()
-        result = await session.execute(
-            select(TournamentManualEntry)
+        .returning(Tournament.id)
+    )
+    new_id = result.scalar_one()
+    # Copy manual entries server-side in one INSERT ... SELECT
+    await session.execute(
+        insert(TournamentManualEntry).from_select(
+            ["tournament_id", "display_name", "epic_id", "list_type", "original_list_type", "sort_order"],
+            select(
+                literal(new_id),
+                TournamentManualEntry.display_name,
+                TournamentManualEntry.epic_id,
+                TournamentManualEntry.list_type,
+                func.coalesce(TournamentManualEntry.original_list_type, TournamentManualEntry.list_type),
+                TournamentManualEntry.sort_order,
+            )
             .where(TournamentManualEntry.tournament_id == tournament_id)
-            .order_by(TournamentManualEntry.list_type, TournamentManualEntry.sort_order, TournamentManualEntry.id)
+            .order_by(TournamentManualEntry.list_type, TournamentManualEntry.sort_order, TournamentManualEntry.id),
         )
-        entries = result.scalars().all()
-        for e in entries:
-            new_entry = TournamentManualEntry(
-                tournament_id=t.id,
-                display_name=e.display_name,
-                epic_id=e.epic_id,
-                list_type=e.list_type,
-                original_list_type=e.original_list_type or e.list_type,
-                sort_order=e.sort_order,
-            )
-            session.add(new_entry)
-        await session.commit()
-        await session.refresh(t)
-        return {"id": t.id, "name": t.name, "format": t.format}
+    )
+    await session.commit()
+    _invalidate_tournament_cache()
+    return {"id": new_id, "name": name, "format": fmt}
 
 
 class PostSignupRequest(BaseModel):
@@ -1104,45 +1400,47 @@ async def post_signup_to_discord(
     tournament_id: int,
     body: Optional[PostSignupRequest] = None,
     user: User = Depends(require_moderator_user),
+    session: AsyncSession = Depends(get_async_session),
 ):
     """Trigger the bot to post the signup message to Discord. Requires Discord settings configured in Settings."""
     if not config.INTERNAL_API_SECRET:
         raise HTTPException(503, "INTERNAL_API_SECRET not configured. Set it in .env to enable web-triggered signup.")
-    async with async_session_factory() as session:
-        t = await session.get(Tournament, tournament_id)
-        if not t:
-            raise HTTPException(404, "Tournament not found")
-        if t.status != "open":
-            raise HTTPException(400, f"Tournament is {t.status}. Set status to 'open' before posting signup.")
-        # Get guild_id and channel_id from body or site settings
-        guild_id = body.guild_id if body and body.guild_id else None
-        channel_id = body.channel_id if body and body.channel_id else None
-        if not guild_id or not channel_id:
-            result = await session.execute(
-                select(SiteSettings).where(
-                    SiteSettings.key.in_(["discord_guild_id", "discord_signup_channel_id"])
-                )
-            )
-            settings = {row.key: row.value for row in result.scalars().all()}
-            try:
-                guild_id = guild_id or (int(settings["discord_guild_id"]) if settings.get("discord_guild_id") else None)
-                channel_id = channel_id or (int(settings["discord_signup_channel_id"]) if settings.get("discord_signup_channel_id") else None)
-            except (ValueError, TypeError):
-                guild_id = guild_id or None
-                channel_id = channel_id or None
-        if not guild_id or not channel_id:
-            raise HTTPException(
-                400,
-                "Configure Discord guild and channel in Settings (Discord signup) first, or pass channel_id and guild_id in the request body.",
+    t = await session.get(Tournament, tournament_id)
+    if not t:
+        raise HTTPException(404, "Tournament not found")
+    if t.status != "open":
+        raise HTTPException(400, f"Tournament is {t.status}. Set status to 'open' before posting signup.")
+    # Get guild_id and channel_id from body or site settings
+    guild_id = body.guild_id if body and body.guild_id else None
+    channel_id = body.channel_id if body and body.channel_id else None
+    if not guild_id or not channel_id:
+        result = await session.execute(
+            select(SiteSettings).where(
+                SiteSettings.key.in_(["discord_guild_id", "discord_signup_channel_id"])
             )
+        )
+        settings = {row.key: row.value for row in result.scalars().all()}
+        try:
+            guild_id = guild_id or (int(settings["discord_guild_id"]) if settings.get("discord_guild_id") else None)
+            channel_id = channel_id or (int(settings["discord_signup_channel_id"]) if settings.get("discord_signup_channel_id") else None)
+        except (ValueError, TypeError):
+            guild_id = guild_id or None
+            channel_id = channel_id or None
+    if not guild_id or not channel_id:
+        raise HTTPException(
+            400,
+            "Configure Discord guild and channel in Settings (Discord signup) first, or pass channel_id and guild_id in the request body.",
+        )
     url = f"{config.BOT_INTERNAL_URL.rstrip('/')}/internal/post-signup"
+    # Return the pooled connection before waiting (up to 15s) on the bot; nothing below touches the DB
+    await session.close()
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            r = await client.post(
-                url,
-                json={"tournament_id": tournament_id, "channel_id": channel_id, "guild_id": guild_id},
-                headers={"Authorization": f"Bearer {config.INTERNAL_API_SECRET}"},
-            )
+        r = await http_client().post(
+            url,
+            json={"tournament_id": tournament_id, "channel_id": channel_id, "guild_id": guild_id},
+            headers={"Authorization": f"Bearer {config.INTERNAL_API_SECRET}"},
+            timeout=15.0,
+        )
     except httpx.ConnectError as e:
         logging.getLogger("octane").warning("Failed to reach bot for post-signup: %s", e)
         raise HTTPException(503, "Could not reach the Discord bot. Ensure it is running and BOT_INTERNAL_URL is correct.")
@@ -1160,173 +1458,192 @@ async def post_signup_to_discord(
 
 
 @router.delete("/tournaments/{tournament_id}")
-async def delete_tournament(tournament_id: int, user: User = Depends(require_moderator_user)):
+async def delete_tournament(
+    tournament_id: int,
+    user: User = Depends(require_moderator_user),
+    session: AsyncSession = Depends(get_async_session),
+):
     """Delete a tournament and all its data."""
-    async with async_session_factory() as session:
-        t = await session.get(Tournament, tournament_id)
-        if not t:
-            raise HTTPException(404, "Tournament not found")
-        name = t.name
-        await session.delete(t)
-        await session.commit()
-        return {"ok": True, "deleted": name}
+    name = (
+        await session.execute(
+            delete(Tournament)
+            .where(Tournament.id == tournament_id)
+            .returning(Tournament.name)
+            .execution_options(synchronize_session=False)
+        )
+    ).scalar_one_or_none()
+    if name is None:
+        raise HTTPException(404, "Tournament not found")
+    # Bulk DELETEs instead of the ORM cascade, which loads every child collection first
+    team_ids = select(Team.id).where(Team.tournament_id == tournament_id)
+    entry_ids = select(TournamentManualEntry.id).where(TournamentManualEntry.tournament_id == tournament_id)
+    await session.execute(
+        delete(TeamManualMember)
+        .where(or_(TeamManualMember.team_id.in_(team_ids), TeamManualMember.manual_entry_id.in_(entry_ids)))
+        .execution_options(synchronize_session=False)
+    )
+    await _delete_bracket(session, tournament_id)
+    for model in (Registration, Team, TournamentManualEntry, TournamentSignupMessage):
+        await session.execute(
+            delete(model).where(model.tournament_id == tournament_id).execution_options(synchronize_session=False)
+        )
+    await session.commit()
+    _invalidate_tournament_cache()
+    return {"ok": True, "deleted": name}
 
 
 # --- Bracket generation (manual) ---
 
 
 @router.post("/tournaments/{tournament_id}/bracket/generate")
-async def generate_bracket(tournament_id: int, body: Optional[GenerateBracketRequest] = None, user: User = Depends(require_moderator_user)):
+async def generate_bracket(
+    tournament_id: int, body: Optional[GenerateBracketRequest] = None,
+    user: User = Depends(require_moderator_user),
+    session: AsyncSession = Depends(get_async_session),
+):
     """Generate bracket from manual participants (and optionally Discord registrations)."""
-    from bot.services.bracket_gen import create_manual_bracket
-
     req = body.model_dump() if body else {}
-    async with async_session_factory() as session:
-        t = await session.get(Tournament, tournament_id)
-        if not t:
-            raise HTTPException(404, "Tournament not found")
-        existing = await session.execute(
-            select(Bracket).where(Bracket.tournament_id == tournament_id)
-        )
-        if existing.scalar_one_or_none():
-            raise HTTPException(400, "Bracket already exists")
-        try:
-            bracket = await create_manual_bracket(session, tournament_id, req)
-        except ValueError as e:
-            raise HTTPException(400, str(e))
-        if not bracket:
-            raise HTTPException(400, "Could not generate bracket. Add participants first.")
-        # Post teams first, then round 1 lineup to Discord when bracket is generated
-        await _post_teams_to_discord(session, tournament_id, t)
-        await _post_bracket_to_discord(session, tournament_id, t)
-        return {"ok": True, "bracket_id": bracket.id}
+    t = await session.get(Tournament, tournament_id)
+    if not t:
+        raise HTTPException(404, "Tournament not found")
+    if await session.scalar(select(exists().where(Bracket.tournament_id == tournament_id))):
+        raise HTTPException(400, "Bracket already exists")
+    try:
+        bracket = await create_manual_bracket(session, tournament_id, req)
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+    if not bracket:
+        raise HTTPException(400, "Could not generate bracket. Add participants first.")
+    # Post teams first, then round 1 lineup to Discord when bracket is generated
+    await _post_teams_to_discord(session, tournament_id, t)
+    await _post_bracket_to_discord(session, tournament_id, t)
+    return {"ok": True, "bracket_id": bracket.id}
 
 
 @router.delete("/tournaments/{tournament_id}/bracket")
-async def delete_bracket(tournament_id: int, user: User = Depends(require_moderator_user)):
+async def delete_bracket(
+    tournament_id: int,
+    user: User = Depends(require_moderator_user),
+    session: AsyncSession = Depends(get_async_session),
+):
     """Delete the bracket. Bracket must be regenerated manually via Generate Bracket."""
-    async with async_session_factory() as session:
-        t = await session.get(Tournament, tournament_id)
-        if not t:
-            raise HTTPException(404, "Tournament not found")
-        existing = await session.execute(
-            select(Bracket).where(Bracket.tournament_id == tournament_id)
-        )
-        bracket = existing.scalar_one_or_none()
-        if bracket:
-            await session.delete(bracket)
-            await session.commit()
-        return {"ok": True}
+    t = await session.get(Tournament, tournament_id)
+    if not t:
+        raise HTTPException(404, "Tournament not found")
+    if await _delete_bracket(session, tournament_id):
+        await session.commit()
+    return {"ok": True}
 
 
 @router.post("/tournaments/{tournament_id}/bracket/regenerate")
-async def regenerate_bracket(tournament_id: int, body: Optional[GenerateBracketRequest] = None, user: User = Depends(require_moderator_user)):
+async def regenerate_bracket(
+    tournament_id: int, body: Optional[GenerateBracketRequest] = None,
+    user: User = Depends(require_moderator_user),
+    session: AsyncSession = Depends(get_async_session),
+):
     """Delete existing bracket and generate a new one from current participants/teams."""
-    from bot.services.bracket_gen import create_manual_bracket
-
     req = body.model_dump() if body else {}
-    async with async_session_factory() as session:
-        t = await session.get(Tournament, tournament_id)
-        if not t:
-            raise HTTPException(404, "Tournament not found")
-        existing = await session.execute(
-            select(Bracket).where(Bracket.tournament_id == tournament_id)
-        )
-        bracket = existing.scalar_one_or_none()
-        if bracket:
-            await session.delete(bracket)
-            await session.flush()
-        try:
-            bracket = await create_manual_bracket(session, tournament_id, req)
-        except ValueError as e:
-            raise HTTPException(400, str(e))
-        if not bracket:
-            raise HTTPException(400, "Could not generate bracket. Add participants first.")
-        # Post teams first, then round 1 lineup to Discord when bracket is generated
-        await _post_teams_to_discord(session, tournament_id, t)
-        await _post_bracket_to_discord(session, tournament_id, t)
-        return {"ok": True, "bracket_id": bracket.id}
+    t = await session.get(Tournament, tournament_id)
+    if not t:
+        raise HTTPException(404, "Tournament not found")
+    await _delete_bracket(session, tournament_id)
+    try:
+        bracket = await create_manual_bracket(session, tournament_id, req)
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+    if not bracket:
+        raise HTTPException(400, "Could not generate bracket. Add participants first.")
+    # Post teams first, then round 1 lineup to Discord when bracket is generated
+    await _post_teams_to_discord(session, tournament_id, t)
+    await _post_bracket_to_discord(session, tournament_id, t)
+    return {"ok": True, "bracket_id": bracket.id}
 
 
 @router.post("/tournaments/{tournament_id}/bracket/post-teams")
-async def post_teams_to_discord(tournament_id: int, user: User = Depends(require_moderator_user)):
+async def post_teams_to_discord(
+    tournament_id: int,
+    user: User = Depends(require_moderator_user),
+    session: AsyncSession = Depends(get_async_session),
+):
     """Manually post teams/participants embed to Discord bracket channel."""
     if not config.INTERNAL_API_SECRET or not config.BOT_INTERNAL_URL:
         raise HTTPException(503, "Discord integration not configured")
-    async with async_session_factory() as session:
-        t = await session.get(Tournament, tournament_id)
-        if not t:
-            raise HTTPException(404, "Tournament not found")
-        guild_id, channel_id = await _get_discord_bracket_channel(session, t)
-        if not (guild_id and channel_id):
-            raise HTTPException(400, "Discord bracket channel not configured. Set it in Settings.")
-        try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                r = await client.post(
-                    f"{config.BOT_INTERNAL_URL.rstrip('/')}/internal/post-teams",
-                    json={"tournament_id": tournament_id, "channel_id": channel_id, "guild_id": guild_id},
-                    headers={"Authorization": f"Bearer {config.INTERNAL_API_SECRET}"},
-                )
-        except Exception as e:
-            raise HTTPException(503, f"Could not reach bot: {e}") from e
-        if r.status_code != 200:
-            err = r.json().get("error", r.text) if r.headers.get("content-type", "").startswith("application/json") else r.text
-            raise HTTPException(400, err)
-        return {"ok": True, "message_id": r.json().get("message_id")}
+    t = await session.get(Tournament, tournament_id)
+    if not t:
+        raise HTTPException(404, "Tournament not found")
+    guild_id, channel_id = await _get_discord_bracket_channel(session, t)
+    if not (guild_id and channel_id):
+        raise HTTPException(400, "Discord bracket channel not configured. Set it in Settings.")
+    try:
+        r = await http_client().post(
+            f"{config.BOT_INTERNAL_URL.rstrip('/')}/internal/post-teams",
+            json={"tournament_id": tournament_id, "channel_id": channel_id, "guild_id": guild_id},
+            headers={"Authorization": f"Bearer {config.INTERNAL_API_SECRET}"},
+        )
+    except Exception as e:
+        raise HTTPException(503, f"Could not reach bot: {e}") from e
+    if r.status_code != 200:
+        err = r.json().get("error", r.text) if r.headers.get("content-type", "").startswith("application/json") else r.text
+        raise HTTPException(400, err)
+    return {"ok": True, "message_id": r.json().get("message_id")}
 
 
 @router.post("/tournaments/{tournament_id}/bracket/post-round")
-async def post_round_to_discord(tournament_id: int, user: User = Depends(require_moderator_user)):
+async def post_round_to_discord(
+    tournament_id: int,
+    user: User = Depends(require_moderator_user),
+    session: AsyncSession = Depends(get_async_session),
+):
     """Manually post current round lineup embed to Discord bracket channel."""
     if not config.INTERNAL_API_SECRET or not config.BOT_INTERNAL_URL:
         raise HTTPException(503, "Discord integration not configured")
-    async with async_session_factory() as session:
-        t = await session.get(Tournament, tournament_id)
-        if not t:
-            raise HTTPException(404, "Tournament not found")
-        guild_id, channel_id = await _get_discord_bracket_channel(session, t)
-        if not (guild_id and channel_id):
-            raise HTTPException(400, "Discord bracket channel not configured. Set it in Settings.")
-        try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                r = await client.post(
-                    f"{config.BOT_INTERNAL_URL.rstrip('/')}/internal/post-bracket",
-                    json={"tournament_id": tournament_id, "channel_id": channel_id, "guild_id": guild_id},
-                    headers={"Authorization": f"Bearer {config.INTERNAL_API_SECRET}"},
-                )
-        except Exception as e:
-            raise HTTPException(503, f"Could not reach bot: {e}") from e
-        if r.status_code != 200:
-            err = r.json().get("error", r.text) if r.headers.get("content-type", "").startswith("application/json") else r.text
-            raise HTTPException(400, err)
-        return {"ok": True, "message_id": r.json().get("message_id")}
+    t = await session.get(Tournament, tournament_id)
+    if not t:
+        raise HTTPException(404, "Tournament not found")
+    guild_id, channel_id = await _get_discord_bracket_channel(session, t)
+    if not (guild_id and channel_id):
+        raise HTTPException(400, "Discord bracket channel not configured. Set it in Settings.")
+    try:
+        r = await http_client().post(
+            f"{config.BOT_INTERNAL_URL.rstrip('/')}/internal/post-bracket",
+            json={"tournament_id": tournament_id, "channel_id": channel_id, "guild_id": guild_id},
+            headers={"Authorization": f"Bearer {config.INTERNAL_API_SECRET}"},
+        )
+    except Exception as e:
+        raise HTTPException(503, f"Could not reach bot: {e}") from e
+    if r.status_code != 200:
+        err = r.json().get("error", r.text) if r.headers.get("content-type", "").startswith("application/json") else r.text
+        raise HTTPException(400, err)
+    return {"ok": True, "message_id": r.json().get("message_id")}
 
 
 @router.post("/tournaments/{tournament_id}/bracket/post-results")
-async def post_results_to_discord(tournament_id: int, user: User = Depends(require_moderator_user)):
+async def post_results_to_discord(
+    tournament_id: int,
+    user: User = Depends(require_moderator_user),
+    session: AsyncSession = Depends(get_async_session),
+):
     """Manually post tournament results embed to Discord bracket channel (requires champion)."""
     if not config.INTERNAL_API_SECRET or not config.BOT_INTERNAL_URL:
         raise HTTPException(503, "Discord integration not configured")
-    async with async_session_factory() as session:
-        t = await session.get(Tournament, tournament_id)
-        if not t:
-            raise HTTPException(404, "Tournament not found")
-        guild_id, channel_id = await _get_discord_bracket_channel(session, t)
-        if not (guild_id and channel_id):
-            raise HTTPException(400, "Discord bracket channel not configured. Set it in Settings.")
-        try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                r = await client.post(
-                    f"{config.BOT_INTERNAL_URL.rstrip('/')}/internal/post-results",
-                    json={"tournament_id": tournament_id, "channel_id": channel_id, "guild_id": guild_id},
-                    headers={"Authorization": f"Bearer {config.INTERNAL_API_SECRET}"},
-                )
-        except Exception as e:
-            raise HTTPException(503, f"Could not reach bot: {e}") from e
-        if r.status_code != 200:
-            err = r.json().get("error", r.text) if r.headers.get("content-type", "").startswith("application/json") else r.text
-            raise HTTPException(400, err)
-        return {"ok": True, "message_id": r.json().get("message_id")}
+    t = await session.get(Tournament, tournament_id)
+    if not t:
+        raise HTTPException(404, "Tournament not found")
+    guild_id, channel_id = await _get_discord_bracket_channel(session, t)
+    if not (guild_id and channel_id):
+        raise HTTPException(400, "Discord bracket channel not configured. Set it in Settings.")
+    try:
+        r = await http_client().post(
+            f"{config.BOT_INTERNAL_URL.rstrip('/')}/internal/post-results",
+            json={"tournament_id": tournament_id, "channel_id": channel_id, "guild_id": guild_id},
+            headers={"Authorization": f"Bearer {config.INTERNAL_API_SECRET}"},
+        )
+    except Exception as e:
+        raise HTTPException(503, f"Could not reach bot: {e}") from e
+    if r.status_code != 200:
+        err = r.json().get("error", r.text) if r.headers.get("content-type", "").startswith("application/json") else r.text
+        raise HTTPException(400, err)
+    return {"ok": True, "message_id": r.json().get("message_id")}
 
 
 # --- Bracket match updates (for drag-drop) ---
@@ -1341,86 +1658,88 @@ class SwapSlotsRequest(BaseModel):
 
 @router.post("/tournaments/{tournament_id}/bracket/matches/swap-slots")
 async def swap_slots_route(
-    tournament_id: int, body: SwapSlotsRequest, user: User = Depends(require_moderator_user)
+    tournament_id: int, body: SwapSlotsRequest, user: User = Depends(require_moderator_user),
+    session: AsyncSession = Depends(get_async_session),
 ):
     """Swap or move entities between two bracket slots. Clears winners for affected matches."""
-    from bot.services.bracket_gen import swap_slots
-
-    async with async_session_factory() as session:
-        try:
-            await swap_slots(
-                session,
-                tournament_id,
-                body.from_match_id,
-                body.from_slot,
-                body.to_match_id,
-                body.to_slot,
-            )
-            await session.commit()
-        except ValueError as e:
-            raise HTTPException(400, str(e))
-        return {"ok": True}
+    try:
+        await swap_slots(
+            session,
+            tournament_id,
+            body.from_match_id,
+            body.from_slot,
+            body.to_match_id,
+            body.to_slot,
+        )
+        await session.commit()
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+    return {"ok": True}
 
 
 @router.post("/tournaments/{tournament_id}/bracket/matches/{match_id}/clear-winner")
 async def clear_match_winner_route(
-    tournament_id: int, match_id: int, user: User = Depends(require_moderator_user)
+    tournament_id: int, match_id: int, user: User = Depends(require_moderator_user),
+    session: AsyncSession = Depends(get_async_session),
 ):
     """Clear the winner of a match. Use when a result was set incorrectly and you need to undo."""
-    from bot.services.bracket_gen import clear_match_winner
-
-    async with async_session_factory() as session:
-        try:
-            await clear_match_winner(session, match_id, tournament_id)
-            await session.commit()
-        except ValueError as e:
-            raise HTTPException(400, str(e))
-        return {"ok": True}
+    try:
+        await clear_match_winner(session, match_id, tournament_id)
+        await session.commit()
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+    return {"ok": True}
 
 
 @router.post("/tournaments/{tournament_id}/bracket/matches/{match_id}/swap-winner")
 async def swap_match_winner_route(
-    tournament_id: int, match_id: int, user: User = Depends(require_moderator_user)
+    tournament_id: int, match_id: int, user: User = Depends(require_moderator_user),
+    session: AsyncSession = Depends(get_async_session),
 ):
     """Swap the winner of a match to the other team. Use when a result was reported incorrectly."""
-    from bot.services.bracket_gen import swap_match_winner
-
-    async with async_session_factory() as session:
-        try:
-            await swap_match_winner(session, match_id, tournament_id)
-            await session.commit()
-        except ValueError as e:
-            raise HTTPException(400, str(e))
-        return {"ok": True}
-
-
-def _champion_match_has_winner(
-    matches_with_winners: list,
-    bracket_type: str,
-    max_round_single_elim: int | None = None,
-    total_match_count: int | None = None,
-) -> bool:
-    """True if the champion (final) match has a winner set. For round_robin, requires ALL matches complete."""
-    if not matches_with_winners:
-        return False
-    if bracket_type == "round_robin":
-        # Round robin: champion only when ALL matches have been played (whole bracket complete)
-        if total_match_count is None:
-            return False
-        return len(matches_with_winners) >= total_match_count
-    if bracket_type == "double_elim":
-        # Champion is ONLY when grand finals (Winners final winner vs Losers final winner) has a winner
-        for m in matches_with_winners:
-            if m.bracket_section == "grand_finals":
-                return True
-        return False
-    # Single elim: the actual final (highest round in bracket) must have a winner
-    single_elim_matches = [m for m in matches_with_winners if m.bracket_section is None]
-    if not single_elim_matches:
-        return False
-    # Use provided max round (from full bracket) so we don't mark complete when only round 1 is done
-    final_round = max_round_single_elim if max_round_single_elim is not None else max(m.round_num for m in single_elim_matches)
-    return any(m.round_num == final_round for m in single_elim_matches)
+    try:
+        await swap_match_winner(session, match_id, tournament_id)
+        await session.commit()
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+    return {"ok": True}
+
+
+async def _champion_declared(session: AsyncSession, bracket: Bracket) -> bool:
+    """True once the bracket's champion is decided, checked with one EXISTS query.
+
+    Round robin: every match has a winner. Double elim: grand finals has a winner. Single elim: a match in
+    the last round of the full bracket has a winner (not just the highest round played so far).
+    """
+    in_bracket = BracketMatch.bracket_id == bracket.id
+    if bracket.bracket_type == "round_robin":
+        decided = and_(
+            select(BracketMatch.id).where(in_bracket).exists(),
+            ~select(BracketMatch.id).where(in_bracket, ~MATCH_HAS_WINNER).exists(),
+        )
+    elif bracket.bracket_type == "double_elim":
+        decided = (
+            select(BracketMatch.id)
+            .where(in_bracket, BracketMatch.bracket_section == "grand_finals", MATCH_HAS_WINNER)
+            .exists()
+        )
+    else:
+        final_round = (
+            select(func.max(BracketMatch.round_num))
+            .where(in_bracket, BracketMatch.bracket_section.is_(None))
+            .scalar_subquery()
+        )
+        decided = (
+            select(BracketMatch.id)
+            .where(
+                in_bracket,
+                BracketMatch.bracket_section.is_(None),
+                BracketMatch.round_num == final_round,
+                MATCH_HAS_WINNER,
+            )
+            .exists()
+        )
+    return bool(await session.scalar(select(decided)))
 
 
 @router.patch("/tournaments/{tournament_id}/bracket/matches/{match_id}")
@@ -1429,165 +1748,133 @@ async def update_match(
     match_id: int,
     body: BracketMatchUpdate,
     user: User = Depends(require_moderator_user),
+    session: AsyncSession = Depends(get_async_session),
 ):
     """Update a bracket match (assign teams/players, set winner). Single elim: advance when round complete (randomize bye, exclude teams that had bye). Double elim: advance immediately. Auto-sets tournament to completed when champion is declared."""
-    from bot.services.bracket_gen import (
-        advance_rounds_until_incomplete,
-        advance_winner_to_parent,
-        round_just_completed,
-    )
-
-    async with async_session_factory() as session:
-        match = await session.get(BracketMatch, match_id)
-        if not match:
-            raise HTTPException(404, "Match not found")
-        bracket = await session.get(Bracket, match.bracket_id)
-        if not bracket or bracket.tournament_id != tournament_id:
-            raise HTTPException(404, "Match not found")
-        t = await session.get(Tournament, bracket.tournament_id)
-        is_team = t and t.format != "1v1"
-        # Use exclude_unset to allow explicit null (e.g. clear slot when team drops out)
-        updates = body.model_dump(exclude_unset=True)
-        winner_updated = any(k in updates for k in ("winner_team_id", "winner_player_id", "winner_manual_entry_id"))
-        setting_winner = winner_updated and any(
-            updates.get(k) for k in ("winner_team_id", "winner_player_id", "winner_manual_entry_id")
+    match = await load_match_with_bracket(session, match_id, tournament_id)
+    if not match:
+        raise HTTPException(404, "Match not found")
+    bracket = match.bracket
+    t = bracket.tournament
+    is_team = t and t.format != "1v1"
+    # Only fields present in the body, so an explicit null clears a slot (e.g. team drops out)
+    updates = {k: getattr(body, k) for k in body.model_fields_set}
+    winner_updated = bool(updates.keys() & _WINNER_KEYS)
+    setting_winner = winner_updated and any(updates.get(k) for k in _WINNER_KEYS)
+    if setting_winner and bracket.bracket_type == "round_robin":
+        # Round robin: only allow setting winner on matches in the current round (first round with unplayed)
+        all_matches_result = await session.execute(
+            select(BracketMatch).where(BracketMatch.bracket_id == bracket.id).order_by(BracketMatch.round_num, BracketMatch.match_num)
         )
-        if setting_winner and bracket.bracket_type == "round_robin":
-            # Round robin: only allow setting winner on matches in the current round (first round with unplayed)
-            all_matches_result = await session.execute(
-                select(BracketMatch).where(BracketMatch.bracket_id == bracket.id).order_by(BracketMatch.round_num, BracketMatch.match_num)
-            )
-            all_matches = list(all_matches_result.scalars().all())
-            unplayed = [m for m in all_matches if not (m.winner_team_id or m.winner_player_id or m.winner_manual_entry_id)]
-            if unplayed:
-                current_round_num = min(m.round_num for m in unplayed)
-                if match.round_num != current_round_num:
-                    raise HTTPException(
-                        400,
-                        f"Complete all matches in Round {current_round_num} before recording results for Round {match.round_num}.",
-                    )
+        all_matches = list(all_matches_result.scalars().all())
+        unplayed = [m for m in all_matches if not (m.winner_team_id or m.winner_player_id or m.winner_manual_entry_id)]
+        if unplayed:
+            current_round_num = min(m.round_num for m in unplayed)
+            if match.round_num != current_round_num:
+                raise HTTPException(
+                    400,
+                    f"Complete all matches in Round {current_round_num} before recording results for Round {match.round_num}.",
+                )
+    previous_winners = {k: getattr(match, k) for k in _WINNER_KEYS}
+    if winner_updated:
+        # When setting a winner, clear the other winner fields to avoid conflicting data
+        if "winner_team_id" not in updates:
+            match.winner_team_id = None
+        if "winner_player_id" not in updates:
+            match.winner_player_id = None
+        if "winner_manual_entry_id" not in updates:
+            match.winner_manual_entry_id = None
+    for key in updates.keys() & _MATCH_COLUMNS:
+        setattr(match, key, updates[key])
+    # Re-submitting the current winner (e.g. a UI retry) should not re-run advancement
+    if winner_updated and all(getattr(match, k) == v for k, v in previous_winners.items()):
+        winner_updated = False
+    champion_declared = False
+    round_advanced = False
+    try:
         if winner_updated:
-            # When setting a winner, clear the other winner fields to avoid conflicting data
-            if "winner_team_id" not in updates:
-                match.winner_team_id = None
-            if "winner_player_id" not in updates:
-                match.winner_player_id = None
-            if "winner_manual_entry_id" not in updates:
-                match.winner_manual_entry_id = None
-        for key, value in updates.items():
-            if hasattr(match, key):
-                setattr(match, key, value)
-        champion_declared = False
-        round_advanced = False
-        try:
-            if winner_updated:
-                await session.flush()  # Ensure winner is visible to advancement queries
-                if bracket.bracket_type == "single_elim":
-                    round_advanced = await advance_rounds_until_incomplete(
-                        session, bracket.id, match.round_num, is_team
-                    )
-                elif bracket.bracket_type == "double_elim":
-                    await advance_winner_to_parent(session, match, is_team)
-                    round_advanced = await round_just_completed(
-                        session,
-                        bracket.id,
-                        "double_elim",
-                        match.round_num,
-                        match.bracket_section,
-                        is_team,
-                    )
-                elif bracket.bracket_type == "round_robin":
-                    round_advanced = await round_just_completed(
-                        session,
-                        bracket.id,
-                        "round_robin",
-                        match.round_num,
-                        None,
-                        is_team,
-                    )
-                else:
-                    await advance_winner_to_parent(session, match, is_team)
-                # Auto-complete tournament when champion is declared (direct or via advancement)
-                champ_matches_result = await session.execute(
-                    select(BracketMatch)
-                    .where(BracketMatch.bracket_id == bracket.id)
-                    .where(
-                        or_(
-                            BracketMatch.winner_team_id != None,  # noqa: E711
-                            BracketMatch.winner_player_id != None,  # noqa: E711
-                            BracketMatch.winner_manual_entry_id != None,  # noqa: E711
-                        )
-                    )
+            # Advancement works on identity-mapped matches, so the new winner is visible without a flush
+            if bracket.bracket_type == "single_elim":
+                round_advanced = await advance_rounds_until_incomplete(
+                    session, bracket.id, match.round_num, is_team
                 )
-                champ_matches = champ_matches_result.scalars().all()
-                max_round = None
-                total_match_count = None
-                if bracket.bracket_type == "single_elim":
-                    max_r = await session.execute(
-                        select(func.max(BracketMatch.round_num)).where(
-                            BracketMatch.bracket_id == bracket.id,
-                            BracketMatch.bracket_section.is_(None),
-                        )
-                    )
-                    max_round = max_r.scalar() or 0
-                elif bracket.bracket_type == "round_robin":
-                    count_r = await session.execute(
-                        select(func.count(BracketMatch.id)).where(BracketMatch.bracket_id == bracket.id)
-                    )
-                    total_match_count = count_r.scalar() or 0
-                champion_declared = _champion_match_has_winner(
-                    champ_matches, bracket.bracket_type, max_round, total_match_count
+            elif bracket.bracket_type == "double_elim":
+                await advance_winner_to_parent(session, match, is_team)
+                round_advanced = await round_just_completed(
+                    session,
+                    bracket.id,
+                    "double_elim",
+                    match.round_num,
+                    match.bracket_section,
+                    is_team,
                 )
-                if champion_declared:
-                    t.status = "completed"
-            await session.commit()
-            # Post to Discord when full round advances or champion declared (if Discord configured)
-            # Single elim: post when a full round completed. Double elim: post when a round completes (Primary + Secondary if both ready).
-            should_post = (
-                (champion_declared or (winner_updated and round_advanced))
-                and config.INTERNAL_API_SECRET
-                and config.BOT_INTERNAL_URL
-            )
-            if should_post:
-                guild_id, channel_id = await _get_discord_bracket_channel(session, t)
-                if guild_id and channel_id:
-                    headers = {"Authorization": f"Bearer {config.INTERNAL_API_SECRET}"}
-                    payload = {
-                        "tournament_id": tournament_id,
-                        "channel_id": channel_id,
-                        "guild_id": guild_id,
-                    }
-                    try:
-                        async with httpx.AsyncClient(timeout=10.0) as client:
-                            if champion_declared:
-                                r = await client.post(
-                                    f"{config.BOT_INTERNAL_URL.rstrip('/')}/internal/post-results",
-                                    json=payload,
-                                    headers=headers,
-                                )
-                                if r.status_code != 200:
-                                    logging.getLogger("octane").warning(
-                                        "post-results failed: %s", r.text
-                                    )
-                            elif round_advanced:
-                                r = await client.post(
-                                    f"{config.BOT_INTERNAL_URL.rstrip('/')}/internal/post-bracket",
-                                    json=payload,
-                                    headers=headers,
-                                )
-                                if r.status_code != 200:
-                                    logging.getLogger("octane").warning(
-                                        "post-bracket failed: %s", r.text
-                                    )
-                    except Exception as e:
-                        logging.getLogger("octane").warning(
-                            "Failed to post to Discord: %s", e
+            elif bracket.bracket_type == "round_robin":
+                round_advanced = await round_just_completed(
+                    session,
+                    bracket.id,
+                    "round_robin",
+                    match.round_num,
+                    None,
+                    is_team,
+                )
+            else:
+                await advance_winner_to_parent(session, match, is_team)
+            # Auto-complete tournament when champion is declared (direct or via advancement)
+            await session.flush()  # Champion check below runs in SQL
+            champion_declared = await _champion_declared(session, bracket)
+            if champion_declared:
+                t.status = "completed"
+        await session.commit()
+        if champion_declared:
+            _invalidate_tournament_cache()
+        # Post to Discord when full round advances or champion declared (if Discord configured)
+        # Single elim: post when a full round completed. Double elim: post when a round completes (Primary + Secondary if both ready).
+        should_post = (
+            (champion_declared or (winner_updated and round_advanced))
+            and config.INTERNAL_API_SECRET
+            and config.BOT_INTERNAL_URL
+        )
+        if should_post:
+            guild_id, channel_id = await _get_discord_bracket_channel(session, t)
+            if guild_id and channel_id:
+                headers = {"Authorization": f"Bearer {config.INTERNAL_API_SECRET}"}
+                payload = {
+                    "tournament_id": tournament_id,
+                    "channel_id": channel_id,
+                    "guild_id": guild_id,
+                }
+                try:
+                    if champion_declared:
+                        r = await http_client().post(
+                            f"{config.BOT_INTERNAL_URL.rstrip('/')}/internal/post-results",
+                            json=payload,
+                            headers=headers,
                         )
-        except Exception as e:
-            await session.rollback()
-            detail = str(e)
-            import logging
-            logging.exception("update_match failed")
-            # Use 400 so nginx passes through; 500 often gets replaced with HTML error page
-            raise HTTPException(400, f"Failed to update match: {detail}")
-        return {"ok": True}
+                        if r.status_code != 200:
+                            logging.getLogger("octane").warning(
+                                "post-results failed: %s", r.text
+                            )
+                    elif round_advanced:
+                        r = await http_client().post(
+                            f"{config.BOT_INTERNAL_URL.rstrip('/')}/internal/post-bracket",
+                            json=payload,
+                            headers=headers,
+                        )
+                        if r.status_code != 200:
+                            logging.getLogger("octane").warning(
+                                "post-bracket failed: %s", r.text
+                            )
+                except Exception as e:
+                    logging.getLogger("octane").warning(
+                        "Failed to post to Discord: %s", e
+                    )
+    except ValueError as e:
+        # Expected bracket-rule violations from the advancement services; no traceback needed
+        await session.rollback()
+        raise HTTPException(400, f"Failed to update match: {e}")
+    except Exception as e:
+        await session.rollback()
+        logging.exception("update_match failed")
+        # Use 400 so nginx passes through; 500 often gets replaced with HTML error page
+        raise HTTPException(400, f"Failed to update match: {e}")
+    return {"ok": True}
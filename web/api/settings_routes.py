@@ -1,16 +1,20 @@
 """Site settings API: title, theme colors (public read, admin write)."""
 from __future__ import annotations
 
+import time
+
 import httpx
 
 import config
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel
 from sqlalchemy import select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from bot.models import SiteSettings
-from bot.models.base import async_session_factory
+from bot.models.base import get_async_session
+from web.api.utils import http_client, json_response
 from web.auth import require_admin_user, require_moderator_user
 
 router = APIRouter(prefix="/api/settings", tags=["settings"])
@@ -24,22 +28,58 @@ DEFAULTS = {
 }
 
 
-async def _get_setting(key: str) -> str:
-    async with async_session_factory() as session:
-        result = await session.execute(select(SiteSettings).where(SiteSettings.key == key))
-        row = result.scalar_one_or_none()
-        return row.value if row else DEFAULTS.get(key, "")
+# Fallback values for Discord settings that were never configured
+_DISCORD_DEFAULTS = dict.fromkeys(
+    (
+        "discord_guild_id",
+        "discord_signup_channel_id",
+        "discord_signup_channel_name",
+        "discord_bracket_guild_id",
+        "discord_bracket_channel_id",
+        "discord_bracket_channel_name",
+    ),
+    "",
+)
+
+# Theme settings are read on every page load. Writes here drop the cache; with several
+# workers (or when the bot writes a setting), other processes pick up a change once the TTL expires.
+_SETTINGS_TTL = 30.0
+_settings_cache: dict[str, tuple[float, dict[str, str]]] = {}
+
+
+def invalidate_cache() -> None:
+    """Drop cached settings after a write."""
+    _settings_cache.clear()
 
 
-async def _set_setting(key: str, value: str) -> None:
-    async with async_session_factory() as session:
-        result = await session.execute(select(SiteSettings).where(SiteSettings.key == key))
-        row = result.scalar_one_or_none()
-        if row:
-            row.value = value
-        else:
-            session.add(SiteSettings(key=key, value=value))
-        await session.commit()
+async def _get_settings(session: AsyncSession, defaults: dict[str, str]) -> dict[str, str]:
+    """Stored values for the keys of defaults in one query, merged over the defaults."""
+    result = await session.execute(
+        select(SiteSettings.key, SiteSettings.value).where(SiteSettings.key.in_(defaults))
+    )
+    return defaults | dict(result.all())
+
+
+async def _cached_settings(session: AsyncSession, name: str, defaults: dict[str, str]) -> dict[str, str]:
+    """_get_settings behind a per-process cache of _SETTINGS_TTL seconds."""
+    now = time.monotonic()
+    hit = _settings_cache.get(name)
+    if hit and hit[0] > now:
+        return hit[1]
+    values = await _get_settings(session, defaults)
+    _settings_cache[name] = (now + _SETTINGS_TTL, values)
+    return values
+
+
+async def _set_settings(session: AsyncSession, values: dict[str, str]) -> None:
+    """Insert or update several settings with one multi-row UPSERT and one commit."""
+    if not values:
+        return
+    stmt = sqlite_insert(SiteSettings).values([{"key": key, "value": value} for key, value in values.items()])
+    await session.execute(
+        stmt.on_conflict_do_update(index_elements=[SiteSettings.key], set_={"value": stmt.excluded.value})
+    )
+    await session.commit()
 
 
 class SettingsResponse(BaseModel):
@@ -59,41 +99,31 @@ class SettingsUpdate(BaseModel):
 
 
 @router.get("", response_model=SettingsResponse)
-async def get_settings():
-    """Get site settings (public, for theming)."""
-    return SettingsResponse(
-        site_title=await _get_setting("site_title"),
-        accent_color=await _get_setting("accent_color"),
-        accent_hover=await _get_setting("accent_hover"),
-        bg_primary=await _get_setting("bg_primary"),
-        bg_secondary=await _get_setting("bg_secondary"),
-    )
+async def get_settings(request: Request, session: AsyncSession = Depends(get_async_session)):
+    """Get site settings (public, for theming). Cached for _SETTINGS_TTL seconds; browsers revalidate via ETag/304."""
+    return json_response(await _cached_settings(session, "theme", DEFAULTS), request=request)
 
 
 @router.patch("", response_model=SettingsResponse)
-async def update_settings(body: SettingsUpdate, admin=Depends(require_admin_user)):
+async def update_settings(
+    body: SettingsUpdate,
+    admin=Depends(require_admin_user),
+    session: AsyncSession = Depends(get_async_session),
+):
     """Update site settings (admin only)."""
     updates = body.model_dump(exclude_unset=True)
-    for key, value in updates.items():
-        if value is not None:
-            await _set_setting(key, value)
-    return SettingsResponse(
-        site_title=await _get_setting("site_title"),
-        accent_color=await _get_setting("accent_color"),
-        accent_hover=await _get_setting("accent_hover"),
-        bg_primary=await _get_setting("bg_primary"),
-        bg_secondary=await _get_setting("bg_secondary"),
-    )
+    await _set_settings(session, {key: value for key, value in updates.items() if value is not None})
+    invalidate_cache()
+    return json_response(await _get_settings(session, DEFAULTS))
 
 
 @router.get("/export")
-async def export_settings(admin=Depends(require_admin_user)):
+async def export_settings(
+    admin=Depends(require_admin_user), session: AsyncSession = Depends(get_async_session)
+):
     """Export all site settings as JSON backup (admin only)."""
-    async with async_session_factory() as session:
-        result = await session.execute(select(SiteSettings))
-        rows = result.scalars().all()
-        backup = {row.key: row.value for row in rows}
-    return JSONResponse(content={"settings": backup})
+    result = await session.execute(select(SiteSettings.key, SiteSettings.value))
+    return json_response({"settings": dict(result.all())})
 
 
 class SettingsImport(BaseModel):
@@ -101,18 +131,10 @@ class SettingsImport(BaseModel):
 
 
 @router.get("/discord")
-async def get_discord_settings():
+async def get_discord_settings(session: AsyncSession = Depends(get_async_session)):
     """Get Discord config for web-triggered signup and bracket posts. Only enabled when INTERNAL_API_SECRET is set."""
     enabled = bool(config.INTERNAL_API_SECRET)
-    return {
-        "enabled": enabled,
-        "discord_guild_id": await _get_setting("discord_guild_id") or "",
-        "discord_signup_channel_id": await _get_setting("discord_signup_channel_id") or "",
-        "discord_signup_channel_name": await _get_setting("discord_signup_channel_name") or "",
-        "discord_bracket_guild_id": await _get_setting("discord_bracket_guild_id") or "",
-        "discord_bracket_channel_id": await _get_setting("discord_bracket_channel_id") or "",
-        "discord_bracket_channel_name": await _get_setting("discord_bracket_channel_name") or "",
-    }
+    return json_response({"enabled": enabled, **await _cached_settings(session, "discord", _DISCORD_DEFAULTS)})
 
 
 class DiscordBracketUpdate(BaseModel):
@@ -123,29 +145,27 @@ class DiscordBracketUpdate(BaseModel):
 
 @router.patch("/discord")
 async def update_discord_bracket(
-    body: DiscordBracketUpdate, admin=Depends(require_admin_user)
+    body: DiscordBracketUpdate,
+    admin=Depends(require_admin_user),
+    session: AsyncSession = Depends(get_async_session),
 ):
     """Update bracket post channel (admin only)."""
     updates = body.model_dump(exclude_unset=True)
-    for key, value in updates.items():
-        await _set_setting(key, value or "")
-    return await get_discord_settings()
-
-
-def _bot_request_headers():
-    return {"Authorization": f"Bearer {config.INTERNAL_API_SECRET}"}
+    await _set_settings(session, {key: value or "" for key, value in updates.items()})
+    invalidate_cache()
+    return await get_discord_settings(session)
 
 
-@router.get("/discord/guilds")
-async def get_discord_guilds(user=Depends(require_moderator_user)):
-    """List guilds the bot is in (for channel picker). Proxies to bot."""
+async def _bot_get(path: str):
+    """GET a path on the bot's internal API and return its JSON. Raises 503 if the bot is unset or unreachable."""
     if not config.INTERNAL_API_SECRET or not config.BOT_INTERNAL_URL:
         raise HTTPException(503, "Discord integration not configured")
-    url = f"{config.BOT_INTERNAL_URL.rstrip('/')}/internal/discord/guilds"
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            r = await client.get(url, headers=_bot_request_headers())
-    except httpx.ConnectError as e:
+        r = await http_client().get(
+            f"{config.BOT_INTERNAL_URL.rstrip('/')}{path}",
+            headers={"Authorization": f"Bearer {config.INTERNAL_API_SECRET}"},
+        )
+    except (httpx.ConnectError, httpx.PoolTimeout) as e:
         raise HTTPException(
             503, "Could not reach the Discord bot. Ensure it is running."
         ) from e
@@ -154,37 +174,27 @@ async def get_discord_guilds(user=Depends(require_moderator_user)):
     return r.json()
 
 
+@router.get("/discord/guilds")
+async def get_discord_guilds(user=Depends(require_moderator_user)):
+    """List guilds the bot is in (for channel picker). Proxies to bot."""
+    return await _bot_get("/internal/discord/guilds")
+
+
 @router.get("/discord/guilds/{guild_id}/channels")
 async def get_discord_channels(
-    guild_id: str, user=Depends(require_moderator_user)
+    guild_id: int, user=Depends(require_moderator_user)
 ):
     """List text channels in a guild (for channel picker). Proxies to bot."""
-    if not config.INTERNAL_API_SECRET or not config.BOT_INTERNAL_URL:
-        raise HTTPException(503, "Discord integration not configured")
-    url = f"{config.BOT_INTERNAL_URL.rstrip('/')}/internal/discord/guilds/{guild_id}/channels"
-    try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            r = await client.get(url, headers=_bot_request_headers())
-    except httpx.ConnectError as e:
-        raise HTTPException(
-            503, "Could not reach the Discord bot. Ensure it is running."
-        ) from e
-    if r.status_code != 200:
-        raise HTTPException(r.status_code, r.text)
-    return r.json()
+    return await _bot_get(f"/internal/discord/guilds/{guild_id}/channels")
 
 
 @router.post("/import")
-async def import_settings(body: SettingsImport, admin=Depends(require_admin_user)):
+async def import_settings(
+    body: SettingsImport,
+    admin=Depends(require_admin_user),
+    session: AsyncSession = Depends(get_async_session),
+):
     """Restore site settings from a JSON backup (admin only). Overwrites existing keys."""
-    async with async_session_factory() as session:
-        result = await session.execute(select(SiteSettings))
-        rows = result.scalars().all()
-        existing = {row.key: row for row in rows}
-        for key, value in body.settings.items():
-            if key in existing:
-                existing[key].value = value
-            else:
-                session.add(SiteSettings(key=key, value=value))
-        await session.commit()
+    await _set_settings(session, body.settings)
+    invalidate_cache()
     return {"ok": True, "restored": len(body.settings)}
@@ -1,16 +1,78 @@
 """Shared API utilities."""
 
+import hashlib
+from functools import lru_cache
+from typing import Any
+
+import httpx
+from fastapi import Request, Response
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+
 from bot.models import Player
 
+_http_client: httpx.AsyncClient | None = None
+
+
+def http_client() -> httpx.AsyncClient:
+    """Shared keep-alive client for calls to the bot's internal API. Created on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared client (app shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
 
 def player_display_name(player: Player | None, player_id: int) -> str:
     """Return human-readable name for a Discord player. Never show raw user ID."""
-    if not player:
-        return "Discord User"
-    name = (player.display_name or "").strip()
+    return display_name_or_default(player.display_name if player else None)
+
+
+@lru_cache(maxsize=4096)
+def display_name_or_default(name: str | None) -> str:
+    """Return a stored Discord display name, or "Discord User" if missing or a raw snowflake.
+
+    Memoized: list and bracket views repeat the same names on many rows.
+    """
+    name = (name or "").strip()
     if name:
         # Only treat as raw ID if it's a long digit string (Discord snowflake)
         if name.isdigit() and len(name) >= 15:
             return "Discord User"
         return name
     return "Discord User"
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """True if the request's If-None-Match already carries etag (weak comparison)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    wanted = etag.removeprefix("W/")
+    return any(v.strip().removeprefix("W/") == wanted for v in header.split(","))
+
+
+def json_response(content: Any, adapter: TypeAdapter | None = None, request: Request | None = None) -> Response:
+    """JSON response serialized by pydantic-core (via adapter if given), skipping FastAPI's jsonable_encoder pass.
+
+    With request, the body hash is sent as ETag and a matching If-None-Match gets an empty 304.
+    """
+    body = adapter.dump_json(content) if adapter is not None else to_json(content)
+    if request is None:
+        return Response(body, media_type="application/json")
+    headers = {"ETag": f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"', "Cache-Control": "no-cache"}
+    if etag_matches(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
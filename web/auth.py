@@ -2,8 +2,12 @@
 from __future__ import annotations
 
 import hashlib
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, NamedTuple, Optional
 
 import jwt
 from fastapi import Depends, Header, HTTPException, status
@@ -14,10 +18,34 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 import config
 from bot.models import User
-from bot.models.base import async_session_factory
+from bot.models.base import async_session_factory, get_async_session
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 http_bearer = HTTPBearer(auto_error=False)
+# Signing key and allow-list built once; config is fixed for the life of the process
+_JWT_KEY = config.JWT_SECRET.encode("utf-8")
+_JWT_ALGORITHMS = [config.JWT_ALGORITHM]
+
+
+class CachedUser(NamedTuple):
+    """Immutable snapshot of a user, as served by get_current_user."""
+
+    id: int
+    username: str
+    role: str
+
+
+# username -> (monotonic expiry, CachedUser), least recently used first. Only get_current_user /
+# require_user read it; moderator and admin checks always load the role from the DB. User writes
+# call invalidate_user, which reaches this process only (the API runs one worker by default).
+_USER_CACHE_TTL = 15.0
+_USER_CACHE_MAX = 1024
+_user_cache: OrderedDict[str, tuple[float, CachedUser]] = OrderedDict()
+
+
+def invalidate_user(username: str) -> None:
+    """Drop a cached user after its role or password changes, or it is deleted."""
+    _user_cache.pop(username, None)
 
 
 def _prepare_password(password: str) -> str:
@@ -39,27 +67,57 @@ def verify_password(plain: str, hashed: str) -> bool:
 def create_access_token(username: str, role: str) -> str:
     expire = datetime.now(timezone.utc) + timedelta(days=config.JWT_EXPIRE_DAYS)
     payload = {"sub": username, "role": role, "exp": expire}
-    return jwt.encode(payload, config.JWT_SECRET, algorithm=config.JWT_ALGORITHM)
+    return jwt.encode(payload, _JWT_KEY, algorithm=config.JWT_ALGORITHM)
 
 
-def decode_token(token: str) -> Optional[dict]:
+# Only the signature check is memoized; time-based claims are validated on every call in decode_token.
+_SIGNATURE_ONLY = {"verify_exp": False, "verify_nbf": False, "verify_iat": False}
+
+
+@lru_cache(maxsize=8192)
+def _verify_token(token: str) -> Optional[MappingProxyType]:
+    """Read-only signature-checked payload, memoized per token string (clients resend the same token)."""
     try:
-        return jwt.decode(token, config.JWT_SECRET, algorithms=[config.JWT_ALGORITHM])
+        return MappingProxyType(jwt.decode(token, _JWT_KEY, algorithms=_JWT_ALGORITHMS, options=_SIGNATURE_ONLY))
     except jwt.InvalidTokenError:
         return None
 
 
-async def get_user_by_username(username: str) -> Optional[User]:
-    async with async_session_factory() as session:
-        result = await session.execute(select(User).where(User.username == username))
-        return result.scalar_one_or_none()
+def _claims_current(payload: Mapping, now: float) -> bool:
+    """True if exp has not passed and nbf/iat are not in the future (PyJWT semantics, no leeway)."""
+    for claim in ("exp", "nbf", "iat"):
+        value = payload.get(claim)
+        if value is None:
+            continue
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return False
+        if value <= now if claim == "exp" else value > now:
+            return False
+    return True
 
 
-async def get_current_user(
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(http_bearer),
-    x_auth_token: Optional[str] = Header(None, alias="X-Auth-Token"),
+def decode_token(token: str) -> Optional[dict]:
+    payload = _verify_token(token)
+    if payload is None or not _claims_current(payload, time.time()):
+        return None
+    return dict(payload)
+
+
+async def get_user_by_username(
+    username: str, session: Optional[AsyncSession] = None
 ) -> Optional[User]:
-    """Return current user from JWT, or None if not authenticated. Accepts Authorization: Bearer or X-Auth-Token (fallback for proxies that strip Authorization)."""
+    """Look up a user by username. Reuses the given session instead of opening a new one."""
+    stmt = select(User).where(User.username == username).limit(1)
+    if session is not None:
+        return (await session.execute(stmt)).scalars().first()
+    async with async_session_factory() as session:
+        return (await session.execute(stmt)).scalars().first()
+
+
+def _request_username(
+    credentials: Optional[HTTPAuthorizationCredentials], x_auth_token: Optional[str]
+) -> Optional[str]:
+    """Username from a valid Authorization: Bearer or X-Auth-Token (fallback for proxies that strip Authorization)."""
     token = None
     if credentials and credentials.credentials:
         token = credentials.credentials
@@ -70,19 +128,37 @@ async def get_current_user(
     payload = decode_token(token)
     if not payload:
         return None
-    username = payload.get("sub")
+    return payload.get("sub") or None
+
+
+async def get_current_user(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(http_bearer),
+    x_auth_token: Optional[str] = Header(None, alias="X-Auth-Token"),
+    session: AsyncSession = Depends(get_async_session),
+) -> Optional[CachedUser]:
+    """Return current user from JWT, or None if not authenticated. Served from _user_cache when fresh."""
+    username = _request_username(credentials, x_auth_token)
     if not username:
         return None
-    user = await get_user_by_username(username)
+    now = time.monotonic()
+    hit = _user_cache.get(username)
+    if hit and hit[0] > now:
+        _user_cache.move_to_end(username)
+        return hit[1]
+    user = await get_user_by_username(username, session)
     if not user:
+        _user_cache.pop(username, None)
         return None
-    return user
+    snapshot = CachedUser(user.id, user.username, user.role)
+    _user_cache[username] = (now + _USER_CACHE_TTL, snapshot)
+    _user_cache.move_to_end(username)
+    if len(_user_cache) > _USER_CACHE_MAX:
+        _user_cache.popitem(last=False)
+    return snapshot
 
 
-async def require_user(
-    user: Optional[User] = Depends(get_current_user),
-) -> User:
-    """Require authenticated user. Raises 401 if not logged in."""
+def _authenticated(user: Optional[User]) -> User:
+    """Return user, or raise 401 if not logged in."""
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -92,6 +168,13 @@ async def require_user(
     return user
 
 
+async def require_user(
+    user: Optional[CachedUser] = Depends(get_current_user),
+) -> CachedUser:
+    """Require authenticated user. Raises 401 if not logged in."""
+    return _authenticated(user)
+
+
 def require_moderator(user: User) -> User:
     """Require moderator or admin role. Raises 403 if insufficient."""
     if user.role not in ("moderator", "admin"):
@@ -106,15 +189,31 @@ def require_admin(user: User) -> User:
     return user
 
 
+async def _fresh_user(
+    credentials: Optional[HTTPAuthorizationCredentials],
+    x_auth_token: Optional[str],
+    session: AsyncSession,
+) -> User:
+    """Load the token's user from the DB (bypassing _user_cache), or raise 401."""
+    username = _request_username(credentials, x_auth_token)
+    user = await get_user_by_username(username, session) if username else None
+    return _authenticated(user)
+
+
+# Role checks read the DB on every request so a downgrade or deletion applies immediately.
 async def require_moderator_user(
-    user: User = Depends(require_user),
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(http_bearer),
+    x_auth_token: Optional[str] = Header(None, alias="X-Auth-Token"),
+    session: AsyncSession = Depends(get_async_session),
 ) -> User:
     """Dependency: require logged-in moderator or admin."""
-    return require_moderator(user)
+    return require_moderator(await _fresh_user(credentials, x_auth_token, session))
 
 
 async def require_admin_user(
-    user: User = Depends(require_user),
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(http_bearer),
+    x_auth_token: Optional[str] = Header(None, alias="X-Auth-Token"),
+    session: AsyncSession = Depends(get_async_session),
 ) -> User:
     """Dependency: require logged-in admin."""
-    return require_admin(user)
+    return require_admin(await _fresh_user(credentials, x_auth_token, session))
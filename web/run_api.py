@@ -1,4 +1,12 @@
-"""Run the bracket API server. Run from project root: python web/run_api.py"""
+"""Run the bracket API server. Run from project root: python web/run_api.py
+
+API_RELOAD=1 runs a single auto-reloading process for development. API_WORKERS (default 1)
+sets the process count; the API's caches (tournaments, settings, users) are in-process and
+invalidated only in the worker that handled a write, so keep one worker unless stale reads
+for a few seconds are acceptable. uvicorn[standard] picks uvloop and httptools automatically
+when installed.
+"""
+import os
 import sys
 from pathlib import Path
 
@@ -8,10 +16,14 @@ sys.path.insert(0, str(_root))
 
 import uvicorn
 
+RELOAD = os.getenv("API_RELOAD") == "1"
+WORKERS = int(os.getenv("API_WORKERS", "1"))
+
 if __name__ == "__main__":
     uvicorn.run(
         "web.api.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        reload=RELOAD,
+        workers=1 if RELOAD else WORKERS,
     )